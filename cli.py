@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 
+import math
 import os
+import sys
 import time
-from datetime import datetime
-from questions import QuestionGenerator, OPERATION_MIXED
 
 # Pythonista-specific import - used if available for better mobile experience
 try:
@@ -12,6 +12,31 @@ try:
 except ImportError:
     IS_PYTHONISTA = False
 
+# Line editing and answer history for input() - not available on all platforms
+try:
+    import readline
+    readline.set_history_length(100)
+except ImportError:
+    pass
+
+# Optional pause (seconds) after notices; the next prompt paces the game by default.
+# Invalid, non-finite or negative values mean no pause (time.sleep rejects them)
+try:
+    NOTICE_DELAY = float(os.environ.get('MATHGAME_NOTICE_DELAY', 0))
+except ValueError:
+    NOTICE_DELAY = 0.0
+if not math.isfinite(NOTICE_DELAY):
+    NOTICE_DELAY = 0.0
+NOTICE_DELAY = max(0.0, NOTICE_DELAY)
+
+# ANSI clear screen + cursor home; written directly instead of spawning 'clear'
+CLEAR_SEQUENCE = "\033[2J\033[H"
+
+# Legacy Windows consoles only honour ANSI escapes once VT mode is enabled,
+# which an empty os.system() call does as a side effect - do it once here
+if os.name == 'nt' and not IS_PYTHONISTA:
+    os.system('')
+
 
 class MathGameCLI:
     """
@@ -29,24 +54,52 @@ class MathGameCLI:
             8: "Arrays",
             9: "Mixed Challenge"
         }
+        self.difficulty_options = {
+            1: "Easy",
+            2: "Medium",
+            3: "Hard",
+            4: "Adaptive (adjusts based on your performance)"
+        }
+        self.mode_options = {
+            1: "Normal Mode (fixed number of rounds)",
+            2: "Timed Challenge (solve as many as possible in 60 seconds)"
+        }
+        
+        # Difficulty change notice still to be shown on the next question
+        # screen (see show_difficulty_change)
+        self._pending_notice = None
+        
+        # Menus never change, so render them once up front
+        self._operation_menu_str = self._render_menu(self.operation_names)
+        self._difficulty_menu_str = self._render_menu(self.difficulty_options)
+        self._mode_menu_str = self._render_menu(self.mode_options)
+        
+    @staticmethod
+    def _render_menu(options):
+        """Render a menu options dictionary as a block of numbered lines"""
+        return "\n".join(f"{key}. {value}" for key, value in sorted(options.items()))
         
     def clear_screen(self):
         """Clear screen using appropriate method based on platform"""
         if IS_PYTHONISTA:
             console.clear()
         else:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            sys.stdout.write(CLEAR_SEQUENCE)
+            sys.stdout.flush()
             
     def display_title(self):
         """Display game title"""
         self.clear_screen()
-        print("\n" + "=" * 60)
-        print("                    M A T H  M A S T E R                   ")
-        print("=" * 60)
-        print("Improve your mental math skills with practice and challenges!")
-        print("=" * 60 + "\n")
+        separator = "=" * 60
+        sys.stdout.write(
+            f"\n{separator}\n"
+            "                    M A T H  M A S T E R                   \n"
+            f"{separator}\n"
+            "Improve your mental math skills with practice and challenges!\n"
+            f"{separator}\n\n"
+        )
         
-    def get_menu_choice(self, prompt, options, allow_quit=True):
+    def get_menu_choice(self, prompt, options, allow_quit=True, rendered=None):
         """
         Get a validated menu choice from user
         
@@ -54,14 +107,17 @@ class MathGameCLI:
             prompt: The question to ask the user
             options: Dictionary of {option_number: option_name}
             allow_quit: Whether to allow 'q' to quit
+            rendered: Pre-rendered options block (built from options if None)
             
         Returns:
             Selected option number or None if quit
         """
+        if rendered is None:
+            rendered = self._render_menu(options)
+            
         while True:
             print(f"\n{prompt}")
-            for key, value in sorted(options.items()):
-                print(f"{key}. {value}")
+            print(rendered)
                 
             if allow_quit:
                 print("q. Quit")
@@ -71,14 +127,16 @@ class MathGameCLI:
             if allow_quit and choice == 'q':
                 return None
                 
+            # Same rule as get_numeric_input: whatever int() accepts
             try:
                 choice = int(choice)
-                if choice in options:
-                    return choice
-                else:
-                    print("Invalid choice. Please try again.")
             except ValueError:
                 print("Invalid input. Please enter a number.")
+                continue
+                
+            if choice in options:
+                return choice
+            print("Invalid choice. Please try again.")
                 
     def get_numeric_input(self, prompt, min_val=None, max_val=None, allow_float=False, default=None):
         """
@@ -94,51 +152,48 @@ class MathGameCLI:
         Returns:
             Validated numeric value
         """
+        # int()/float() decide what counts as a number ('+5', '.5', '1e2', ...)
+        convert = float if allow_float else int
+        
         while True:
-            try:
-                user_input = input(prompt).strip()
-                if not user_input and default is not None:
-                    return default
-                    
-                value = float(user_input) if allow_float else int(user_input)
+            user_input = input(prompt).strip()
+            if not user_input and default is not None:
+                return default
                 
-                if (min_val is not None and value < min_val) or (max_val is not None and value > max_val):
-                    print(f"Value must be between {min_val} and {max_val}.")
-                    continue
-                    
-                return value
+            try:
+                value = convert(user_input)
             except ValueError:
                 print("Please enter a valid number.")
+                continue
+            
+            if (min_val is not None and value < min_val) or (max_val is not None and value > max_val):
+                print(f"Value must be between {min_val} and {max_val}.")
+                continue
+                
+            return value
                 
     def show_operation_menu(self):
         """Show the operation selection menu and get choice"""
         return self.get_menu_choice(
             "Choose an operation to practice:",
-            self.operation_names
+            self.operation_names,
+            rendered=self._operation_menu_str
         )
         
     def show_difficulty_menu(self):
         """Show the difficulty selection menu and get choice"""
-        difficulty_options = {
-            1: "Easy",
-            2: "Medium",
-            3: "Hard",
-            4: "Adaptive (adjusts based on your performance)"
-        }
         return self.get_menu_choice(
             "Select difficulty level:",
-            difficulty_options
+            self.difficulty_options,
+            rendered=self._difficulty_menu_str
         )
         
     def show_game_mode_menu(self):
         """Show the game mode selection menu and get choice"""
-        mode_options = {
-            1: "Normal Mode (fixed number of rounds)",
-            2: "Timed Challenge (solve as many as possible in 60 seconds)"
-        }
         return self.get_menu_choice(
             "Select game mode:",
-            mode_options
+            self.mode_options,
+            rendered=self._mode_menu_str
         )
         
     def get_rounds(self):
@@ -176,14 +231,15 @@ class MathGameCLI:
                     continue
                     
                 # Handle fraction input (format: a/b)
-                if '/' in user_answer:
-                    parts = user_answer.split('/')
-                    if len(parts) != 2:
+                slash_count = user_answer.count('/')
+                if slash_count:
+                    if slash_count != 1:
                         print("Invalid fraction format. Use a/b format.")
                         continue
+                    numerator, _, denominator = user_answer.partition('/')
                     try:
-                        numerator = int(parts[0])
-                        denominator = int(parts[1])
+                        numerator = int(numerator)
+                        denominator = int(denominator)
                         if denominator == 0:
                             print("Denominator cannot be zero.")
                             continue
@@ -207,15 +263,18 @@ class MathGameCLI:
     def get_answer_timed(self, question, round_num, remaining_time):
         """Get answer with time tracking for timed mode"""
         self.clear_screen()
+        if self._pending_notice:
+            print(f"\n{self._pending_notice}")
+            self._pending_notice = None
         print(f"\nTime remaining: {int(remaining_time)} seconds")
         print(f"Question {round_num}")
         print(f"Calculate: {question}")
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             user_answer = input("Your answer: ").strip()
-            time_taken = (datetime.now() - start_time).total_seconds()
+            time_taken = time.perf_counter() - start_time
             
             if not user_answer:
                 return None, time_taken
@@ -231,38 +290,50 @@ class MathGameCLI:
         time_str = f"Time: {result['time_taken']:.2f} seconds"
         score_str = f"Score: +{score}" if result['correct'] else "Score: +0"
         
-        print(f"\n{correct_str}")
+        # Collect the lines and emit them with a single print
+        lines = [f"\n{correct_str}"]
         if not result['correct']:
-            print(answer_str)
-        print(time_str)
-        print(score_str)
+            lines.append(answer_str)
+        lines.append(time_str)
+        lines.append(score_str)
         
         if streak_message:
-            print(f"\n{streak_message}")
+            lines.append(f"\n{streak_message}")
             
-        print("\nPress Enter to continue...")
+        lines.append("\nPress Enter to continue...")
+        print("\n".join(lines))
         input()
         
     def show_difficulty_change(self, message):
-        """Show difficulty change message"""
+        """
+        Show difficulty change message
+        
+        The next question screen clears this one right away, so the message
+        is repeated there, where the answer prompt keeps it on screen.
+        """
         print(f"\n{message}")
-        time.sleep(1.5)
+        self._pending_notice = message
+        if NOTICE_DELAY:
+            time.sleep(NOTICE_DELAY)
         
     def show_game_summary(self, stats):
         """Show game summary statistics"""
         self.clear_screen()
-        print("\n" + "=" * 60)
-        print("                   GAME SUMMARY                   ")
-        print("=" * 60)
-        
-        print(f"Rounds played: {stats['total_rounds']}")
-        print(f"Correct answers: {stats['correct_count']}/{stats['total_rounds']}")
-        print(f"Accuracy: {stats['accuracy']:.1f}%")
-        print(f"Average time per question: {stats['avg_time']:.2f} seconds")
-        print(f"Total score: {stats['total_score']}")
-        print("=" * 60)
         
-        print("\nPress Enter to return to the main menu...")
+        # Build the whole block and write it in one go
+        separator = "=" * 60
+        sys.stdout.write(
+            f"\n{separator}\n"
+            "                   GAME SUMMARY                   \n"
+            f"{separator}\n"
+            f"Rounds played: {stats['total_rounds']}\n"
+            f"Correct answers: {stats['correct_count']}/{stats['total_rounds']}\n"
+            f"Accuracy: {stats['accuracy']:.1f}%\n"
+            f"Average time per question: {stats['avg_time']:.2f} seconds\n"
+            f"Total score: {stats['total_score']}\n"
+            f"{separator}\n"
+            "\nPress Enter to return to the main menu...\n"
+        )
         input()
         
     def show_timed_start(self, time_limit):
@@ -275,18 +346,21 @@ class MathGameCLI:
     def show_timed_summary(self, stats):
         """Show timed challenge summary"""
         self.clear_screen()
-        print("\n" + "=" * 60)
-        print("              TIMED CHALLENGE RESULTS              ")
-        print("=" * 60)
         
-        print(f"Problems attempted: {stats['total_rounds']}")
-        print(f"Correctly solved: {stats['correct_count']}")
-        print(f"Accuracy: {stats['accuracy']:.1f}%")
-        print(f"Average time per problem: {stats['avg_time']:.2f} seconds")
-        print(f"Total score: {stats['total_score']}")
-        print("=" * 60)
-        
-        print("\nPress Enter to return to the main menu...")
+        # Build the whole block and write it in one go
+        separator = "=" * 60
+        sys.stdout.write(
+            f"\n{separator}\n"
+            "              TIMED CHALLENGE RESULTS              \n"
+            f"{separator}\n"
+            f"Problems attempted: {stats['total_rounds']}\n"
+            f"Correctly solved: {stats['correct_count']}\n"
+            f"Accuracy: {stats['accuracy']:.1f}%\n"
+            f"Average time per problem: {stats['avg_time']:.2f} seconds\n"
+            f"Total score: {stats['total_score']}\n"
+            f"{separator}\n"
+            "\nPress Enter to return to the main menu...\n"
+        )
         input()
         
     def show_pythonista_tips(self):
@@ -296,4 +370,5 @@ class MathGameCLI:
             print("- Use the numeric keyboard for faster input")
             print("- Try landscape mode for a better view")
             print("- Tap the editor to hide this game and resume later\n")
-            time.sleep(2)
+            if NOTICE_DELAY:
+                time.sleep(NOTICE_DELAY)
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
 import random
-from datetime import datetime
 import time
+from collections import deque
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
 
 # Constants
 APP_NAME = "MathMaster"
@@ -12,9 +15,86 @@ MAX_ROUNDS = 10
 POINTS_BASE = 100  # Base points for correct answer
 POINTS_SPEED_BONUS_THRESHOLD = 5.0  # Seconds threshold for speed bonus
 POINTS_SPEED_BONUS = 50  # Bonus for quick answers
-POINTS_DIFFICULTY_MULTIPLIER = [1, 1.5, 2.5]  # Multipliers for each difficulty level
+POINTS_DIFFICULTY_MULTIPLIER_X10 = (10, 15, 25)  # Multipliers (x10) for each difficulty level
 STREAK_BONUS_THRESHOLD = 3  # Number of correct answers in a row to get streak bonus
 STREAK_BONUS = 25  # Points for maintaining a streak
+ADAPTIVE_WINDOW = 3  # Number of recent rounds considered by adaptive difficulty
+
+# Answer tolerance for decimal comparisons
+FLOAT_TOLERANCE = 0.001
+
+
+@lru_cache(maxsize=1024)
+def _parse_answer(answer_str):
+    """
+    Parse an answer string into a (kind, value) tuple
+
+    kind is one of 'int', 'frac', 'float' or 'str'. Results are cached since
+    the same correct answers and user inputs come up again and again.
+    """
+    try:
+        return ('int', int(answer_str))
+    except ValueError:
+        pass
+        
+    if '/' in answer_str:
+        try:
+            return ('frac', Fraction(answer_str))
+        except (ValueError, ZeroDivisionError):
+            return ('str', answer_str)
+            
+    try:
+        return ('float', float(answer_str))
+    except ValueError:
+        return ('str', answer_str)
+
+
+def _check_exact_answer(user_str, correct_value):
+    """Compare user input against an int or Fraction correct answer"""
+    user_kind, user_value = _parse_answer(user_str)
+    if user_kind == 'str':
+        return False
+    if user_kind == 'float':
+        # Decimal input is compared exactly too ("0.5" matches 1/2, "0.334"
+        # doesn't match 1/3); Decimal keeps the digits as typed
+        return Decimal(user_str) == correct_value
+    # int and Fraction compare exactly with each other
+    return user_value == correct_value
+
+
+def _check_int_answer(user_str, correct_value):
+    """Compare user input against an integer correct answer"""
+    try:
+        return int(user_str) == correct_value
+    except ValueError:
+        # Still accept equivalent forms such as 6/2 or 3.0
+        return _check_exact_answer(user_str, correct_value)
+
+
+def _check_float_answer(user_str, correct_value):
+    """Compare user input against a decimal correct answer with tolerance"""
+    user_kind, user_value = _parse_answer(user_str)
+    if user_kind == 'str':
+        return False
+    try:
+        return abs(float(user_value) - correct_value) < FLOAT_TOLERANCE
+    except OverflowError:
+        # An int or fraction too large for a float can't be near the answer
+        return False
+
+
+def _check_str_answer(user_str, correct_value):
+    """Non-numeric answers only match exactly (already checked by the caller)"""
+    return False
+
+
+# Answer comparators keyed by the kind of the correct answer
+_ANSWER_CHECKS = {
+    'int': _check_int_answer,
+    'frac': _check_exact_answer,
+    'float': _check_float_answer,
+    'str': _check_str_answer
+}
 
 
 class MathGame:
@@ -26,11 +106,52 @@ class MathGame:
         self.difficulty = 1
         self.adaptive_difficulty = False
         self.rounds = MAX_ROUNDS
-        self.results = []
-        self.streak_count = 0
-        self.total_score = 0
         self.timed_mode = False
         self.time_limit = 60  # Default 60 seconds for timed mode
+        self._reset_results()
+        
+    def _reset_results(self):
+        """
+        Clear per-round results, streak and running totals
+        """
+        # Results are kept as parallel lists (one entry per round)
+        self._correct = []
+        self._times = []
+        self._scores = []
+        self._questions = []
+        self._user_answers = []
+        self._correct_answers = []
+        
+        # Rolling window of the most recent rounds for adaptive difficulty
+        self._recent_correct = deque(maxlen=ADAPTIVE_WINDOW)
+        self._recent_times = deque(maxlen=ADAPTIVE_WINDOW)
+        
+        # Running totals so get_game_stats doesn't rescan the results
+        self._correct_count = 0
+        self._time_sum = 0.0
+        
+        self.streak_count = 0
+        self.total_score = 0
+        
+    @property
+    def results(self):
+        """
+        Per-round results rebuilt as a list of dicts (for display/export only)
+        """
+        return [
+            {
+                'correct': correct,
+                'time_taken': time_taken,
+                'question': question,
+                'user_answer': user_answer,
+                'correct_answer': correct_answer,
+                'score': score
+            }
+            for correct, time_taken, question, user_answer, correct_answer, score in zip(
+                self._correct, self._times, self._questions,
+                self._user_answers, self._correct_answers, self._scores
+            )
+        ]
         
     def setup_game(self, operation_type, difficulty_choice, rounds=MAX_ROUNDS, timed_mode=False, time_limit=60):
         """
@@ -38,9 +159,7 @@ class MathGame:
         """
         self.operation_type = operation_type
         self.rounds = rounds
-        self.results = []
-        self.streak_count = 0
-        self.total_score = 0
+        self._reset_results()
         self.timed_mode = timed_mode
         self.time_limit = time_limit
         
@@ -55,29 +174,33 @@ class MathGame:
     def generate_question(self, question_module):
         """
         Generate a question using the question_module based on operation type and difficulty
+        
+        Returns:
+            Tuple of (question, correct_answer, answer_kind) where answer_kind
+            is 'int', 'frac', 'float' or 'str' and selects the comparison used
+            by check_answer
         """
-        return question_module.generate_question(self.operation_type, self.difficulty)
+        question, correct_answer = question_module.generate_question(self.operation_type, self.difficulty)
+        correct_answer = str(correct_answer).strip()
+        answer_kind = _parse_answer(correct_answer)[0]
+        return question, correct_answer, answer_kind
     
     def calculate_score(self, is_correct, time_taken):
         """
         Calculate score based on correctness, time, and difficulty
         """
-        if not is_correct:
-            return 0
+        # Base score for correct answer (integer math, multipliers are x10)
+        score = POINTS_BASE * POINTS_DIFFICULTY_MULTIPLIER_X10[self.difficulty - 1] // 10
         
-        # Base score for correct answer
-        score = POINTS_BASE * POINTS_DIFFICULTY_MULTIPLIER[self.difficulty - 1]
+        # Speed bonus for quick answers (zero once past the threshold)
+        speed_factor = max(0.0, POINTS_SPEED_BONUS_THRESHOLD - time_taken) / POINTS_SPEED_BONUS_THRESHOLD
+        speed_bonus = POINTS_SPEED_BONUS * speed_factor
         
-        # Speed bonus for quick answers
-        if time_taken < POINTS_SPEED_BONUS_THRESHOLD:
-            speed_factor = max(0, (POINTS_SPEED_BONUS_THRESHOLD - time_taken) / POINTS_SPEED_BONUS_THRESHOLD)
-            score += POINTS_SPEED_BONUS * speed_factor
+        # Streak bonus (zero below the threshold)
+        streak_over = max(0, self.streak_count - STREAK_BONUS_THRESHOLD)
+        streak_bonus = (self.streak_count >= STREAK_BONUS_THRESHOLD) * STREAK_BONUS * (1 + streak_over * 0.1)
         
-        # Streak bonus
-        if self.streak_count >= STREAK_BONUS_THRESHOLD:
-            score += STREAK_BONUS * (1 + (self.streak_count - STREAK_BONUS_THRESHOLD) * 0.1)
-        
-        return int(score)
+        return int((score + speed_bonus + streak_bonus) * is_correct)
     
     def adjust_difficulty(self):
         """
@@ -86,18 +209,17 @@ class MathGame:
         if not self.adaptive_difficulty:
             return None  # No change
             
-        # Get the last 3 rounds or fewer if not enough
-        recent_results = self.results[-3:]
-        if len(recent_results) < 3:
+        # Need a full window of recent rounds
+        if len(self._recent_correct) < ADAPTIVE_WINDOW:
             return None  # Not enough data
             
-        correct_count = sum(1 for r in recent_results if r['correct'])
-        avg_time = sum(r['time_taken'] for r in recent_results) / len(recent_results)
+        correct_count = sum(self._recent_correct)
+        avg_time = sum(self._recent_times) / ADAPTIVE_WINDOW
         
         old_difficulty = self.difficulty
         
         # Adjust difficulty based on performance
-        if correct_count == 3 and avg_time < 5.0:  # All correct and fast
+        if correct_count == ADAPTIVE_WINDOW and avg_time < 5.0:  # All correct and fast
             self.difficulty = min(3, self.difficulty + 1)  # Increase difficulty (max 3)
         elif correct_count <= 1:  # Poor performance
             self.difficulty = max(1, self.difficulty - 1)  # Decrease difficulty (min 1)
@@ -134,7 +256,8 @@ class MathGame:
         """
         Calculate and return game statistics
         """
-        if not self.results:
+        total_rounds = len(self._correct)
+        if not total_rounds:
             return {
                 'total_rounds': 0,
                 'correct_count': 0,
@@ -143,11 +266,10 @@ class MathGame:
                 'total_score': 0
             }
             
-        total_rounds = len(self.results)
-        correct_count = sum(1 for r in self.results if r['correct'])
-        accuracy = (correct_count / total_rounds) * 100 if total_rounds > 0 else 0
-        avg_time = sum(r['time_taken'] for r in self.results) / total_rounds if total_rounds > 0 else 0
-        total_score = sum(r.get('score', 0) for r in self.results)
+        correct_count = self._correct_count
+        accuracy = (correct_count / total_rounds) * 100
+        avg_time = self._time_sum / total_rounds
+        total_score = self.total_score
         
         return {
             'total_rounds': total_rounds,
@@ -159,10 +281,22 @@ class MathGame:
     
     def add_result(self, round_result):
         """
-        Add a round result to the results list
+        Add a round result to the results lists
         """
-        self.results.append(round_result)
-        self.total_score += round_result.get('score', 0)
+        score = round_result.get('score', 0)
+        self._correct.append(round_result['correct'])
+        self._times.append(round_result['time_taken'])
+        self._scores.append(score)
+        self._questions.append(round_result.get('question'))
+        self._user_answers.append(round_result.get('user_answer'))
+        self._correct_answers.append(round_result.get('correct_answer'))
+        
+        self._recent_correct.append(round_result['correct'])
+        self._recent_times.append(round_result['time_taken'])
+        
+        self.total_score += score
+        self._correct_count += round_result['correct']
+        self._time_sum += round_result['time_taken']
         
     def play_timed_challenge(self, ui_handler, question_module):
         """
@@ -170,14 +304,16 @@ class MathGame:
         within a time limit
         """
         # Reset results for this session
-        self.results = []
-        self.streak_count = 0
-        self.total_score = 0
+        self._reset_results()
         
         start_time = time.time()
         end_time = start_time + self.time_limit
         round_num = 1
         
+        # One round record reused for every round - add_result copies the
+        # fields into the result lists and the UI only reads it
+        result = {}
+        
         ui_handler.show_timed_start(self.time_limit)
         
         while time.time() < end_time:
@@ -185,34 +321,28 @@ class MathGame:
             remaining_time = max(0, end_time - time.time())
             
             # Generate question
-            question, correct_answer = self.generate_question(question_module)
+            question, correct_answer, answer_kind = self.generate_question(question_module)
             
-            # Get user input with time tracking
-            round_start = datetime.now()
-            user_answer, input_time_taken = ui_handler.get_answer_timed(
+            # Get user input (the UI handler times the answer itself)
+            user_answer, time_taken = ui_handler.get_answer_timed(
                 question, round_num, remaining_time
             )
-            round_end = datetime.now()
             
             # If time's up or user quit
             if user_answer == "__TIME_UP__" or user_answer == "__QUIT__":
                 break
-                
-            time_taken = (round_end - round_start).total_seconds()
             
             # Check answer and calculate score
-            is_correct = self.check_answer(user_answer, correct_answer)
+            is_correct = self.check_answer(user_answer, correct_answer, answer_kind)
             score = self.calculate_score(is_correct, time_taken)
             
-            # Create result and add to results
-            result = {
-                'correct': is_correct,
-                'time_taken': time_taken,
-                'question': question,
-                'user_answer': user_answer,
-                'correct_answer': correct_answer,
-                'score': score
-            }
+            # Fill in the round record and add it to results
+            result['correct'] = is_correct
+            result['time_taken'] = time_taken
+            result['question'] = question
+            result['user_answer'] = user_answer
+            result['correct_answer'] = correct_answer
+            result['score'] = score
             self.add_result(result)
             
             # Update streak
@@ -230,71 +360,32 @@ class MathGame:
             round_num += 1
         
         # Show final results
-        ui_handler.show_timed_summary(self.get_game_stats())
-        return self.get_game_stats()
+        stats = self.get_game_stats()
+        ui_handler.show_timed_summary(stats)
+        return stats
     
-    def check_answer(self, user_answer, correct_answer):
+    def check_answer(self, user_answer, correct_answer, answer_kind=None):
         """
         Check if the user's answer is correct
+        
+        Args:
+            user_answer: The answer given by the user
+            correct_answer: The expected answer
+            answer_kind: Kind of the correct answer as returned by
+                generate_question, whose correct_answer is already a stripped
+                string (None for any other answer; its kind is detected)
         """
         if user_answer is None:
             return False
             
-        # Convert answers to strings for comparison
+        # Convert answers to strings for comparison (user input is not
+        # interned - that would grow the intern table with arbitrary input)
         user_str = str(user_answer).strip()
-        correct_str = str(correct_answer).strip()
+        correct_str = correct_answer if answer_kind else str(correct_answer).strip()
         
         # Direct string comparison first (handles exact matches)
         if user_str == correct_str:
             return True
             
-        # Try to normalize fractions for comparison
-        try:
-            import fractions
-            
-            # Convert both to fractions if possible
-            if '/' in user_str and '/' in correct_str:
-                user_parts = user_str.split('/')
-                correct_parts = correct_str.split('/')
-                
-                if len(user_parts) == 2 and len(correct_parts) == 2:
-                    try:
-                        user_frac = fractions.Fraction(int(user_parts[0]), int(user_parts[1]))
-                        correct_frac = fractions.Fraction(int(correct_parts[0]), int(correct_parts[1]))
-                        return user_frac == correct_frac
-                    except (ValueError, ZeroDivisionError):
-                        pass  # Fall through to other methods if fraction conversion fails
-            
-            # Try creating fractions from any numeric format
-            try:
-                # Try to convert user answer to Fraction regardless of format
-                if '/' in user_str:
-                    user_frac = fractions.Fraction(user_str)
-                else:
-                    user_frac = fractions.Fraction(float(user_str))
-                    
-                # Try to convert correct answer to Fraction regardless of format
-                if '/' in correct_str:
-                    correct_frac = fractions.Fraction(correct_str)
-                else:
-                    correct_frac = fractions.Fraction(float(correct_str))
-                    
-                return user_frac == correct_frac
-            except (ValueError, ZeroDivisionError):
-                pass  # Fall through to float comparison
-            
-            # Handle float comparisons with small tolerance
-            try:
-                user_float = float(user_str) if '/' not in user_str else float(user_parts[0]) / float(user_parts[1])
-                correct_float = float(correct_str) if '/' not in correct_str else float(correct_parts[0]) / float(correct_parts[1])
-                # Allow small tolerance for floating point
-                return abs(user_float - correct_float) < 0.001
-            except (ValueError, ZeroDivisionError):
-                pass  # Fall through to final direct comparison
-                
-        except Exception as e:
-            # If any unexpected error occurs, log it and continue to direct comparison
-            print(f"Error comparing answers: {e}")
-            
-        # Final fallback: direct string comparison
-        return user_str == correct_str
+        kind, correct_value = _parse_answer(correct_str)
+        return _ANSWER_CHECKS[answer_kind or kind](user_str, correct_value)
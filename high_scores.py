@@ -1,10 +1,91 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+import copy
 import json
 import time
+import atexit
+import weakref
 from questions import QuestionGenerator
 
+# Faster JSON encoder/decoder if available - falls back to the stdlib
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    _loads = json.loads
+
+# Turns an operation name into its score-file key in one pass
+# ("Mixed Challenge" -> "mixed_challenge")
+_OP_KEY_TRANS = str.maketrans({" ": "_", **{c: c.lower() for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}})
+
+# Operation display names and score-file keys, indexed by operation type;
+# index 0 is the "Unknown" placeholder
+_OP_NAMES = tuple(QuestionGenerator.get_operation_name(op) for op in range(10))
+_OP_KEYS = tuple(name.translate(_OP_KEY_TRANS) for name in _OP_NAMES)
+_UNKNOWN_OP_KEY = _OP_KEYS[0]
+
+# Difficulty score-file keys and display names, indexed by difficulty (1-3)
+_DIFF_KEYS = ("", "difficulty_1", "difficulty_2", "difficulty_3")
+_DIFF_NAMES = ("", "Easy", "Medium", "Hard")
+
+
+def _op_key(operation_type):
+    """Return the score-file key for an operation type"""
+    if 0 < operation_type < len(_OP_KEYS):
+        return _OP_KEYS[operation_type]
+    return _UNKNOWN_OP_KEY
+
+
+def _diff_key(difficulty):
+    """Return the score-file key for a difficulty level"""
+    if difficulty in (1, 2, 3):
+        return _DIFF_KEYS[difficulty]
+    return f"difficulty_{difficulty}"
+
+
+# Returned (as a copy) when no score has been recorded yet
+_EMPTY_RECORD = {"score": 0, "date": "", "accuracy": 0, "avg_time": 0}
+
+# Empty scores structure for a fresh scores file, built once and deep-copied
+# for each new manager
+_DEFAULT_SCORES_TEMPLATE = {
+    **{
+        mode: {
+            _OP_KEYS[op]: {_DIFF_KEYS[diff]: dict(_EMPTY_RECORD) for diff in range(1, 4)}
+            for op in range(1, 10)  # 1-9 operation types
+        }
+        for mode in ("normal_mode", "timed_mode")
+    },
+    "last_played": {},
+    "stats": {
+        "total_problems_solved": 0,
+        "total_time_played": 0,
+        "games_played": 0
+    }
+}
+
+
+# Managers with possibly unsaved changes, flushed by one exit hook. Weak
+# references, so the hook doesn't keep finished managers alive
+_live_managers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    """Save pending changes of every manager still alive at exit"""
+    for manager in list(_live_managers):
+        manager.flush()
+
+
 class HighScoreManager:
     """
     Class to handle high score tracking and persistence
@@ -12,70 +93,65 @@ class HighScoreManager:
     def __init__(self):
         self.scores_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'high_scores.json')
         self.scores = self._load_scores()
+        self._index_scores()
+        
+        # Changes are kept in memory and written once by flush()
+        self._dirty = False
+        
+        _live_managers.add(self)
         
     def _load_scores(self):
         """Load scores from file if it exists, otherwise create new"""
         if os.path.exists(self.scores_file):
             try:
-                with open(self.scores_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                with open(self.scores_file, 'rb') as f:
+                    return _loads(f.read())
+            except (ValueError, IOError):  # JSON decode errors are ValueErrors
                 print("Error loading high scores file. Creating new one.")
                 return self._create_default_scores()
         else:
             return self._create_default_scores()
     
+    def _index_scores(self):
+        """
+        Build the flat (mode, op_key, diff_key) -> record index over self.scores
+        
+        The index holds the same record dicts as the nested structure, so
+        lookups are a single dict hit and self.scores stays ready to save.
+        """
+        self._flat = {}
+        for mode in ("normal_mode", "timed_mode"):
+            for op_key, op_scores in self.scores.get(mode, {}).items():
+                for diff_key, record in op_scores.items():
+                    self._flat[(mode, op_key, diff_key)] = record
+    
     def _create_default_scores(self):
         """Create default empty scores structure"""
-        scores = {
-            "normal_mode": {},
-            "timed_mode": {},
-            "last_played": {},
-            "stats": {
-                "total_problems_solved": 0,
-                "total_time_played": 0,
-                "games_played": 0
-            }
-        }
-        
-        # Define operation names directly to avoid issues with static method
-        operation_names = {
-            1: "addition",
-            2: "subtraction",
-            3: "multiplication",
-            4: "division",
-            5: "fractions",
-            6: "percentages",
-            7: "exponents",
-            8: "arrays",
-            9: "mixed_challenge"
-        }
-        
-        # Initialize scores for each operation and difficulty
-        for mode in ["normal_mode", "timed_mode"]:
-            for op in range(1, 10):  # 1-9 operation types
-                op_name = operation_names[op]
-                scores[mode][op_name] = {}
-                for diff in range(1, 4):  # 1-3 difficulty levels
-                    scores[mode][op_name][f"difficulty_{diff}"] = {
-                        "score": 0,
-                        "date": "",
-                        "accuracy": 0,
-                        "avg_time": 0
-                    }
-                    
-        return scores
+        return copy.deepcopy(_DEFAULT_SCORES_TEMPLATE)
     
     def _save_scores(self):
         """Save scores to file"""
+        # Write to a temp file and swap it in so a failed or interrupted
+        # save can't leave a truncated scores file behind
+        tmp_file = self.scores_file + '.tmp'
         try:
-            with open(self.scores_file, 'w') as f:
-                json.dump(self.scores, f, indent=2)
-                return True
-        except IOError:
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(self.scores))
+            os.replace(tmp_file, self.scores_file)
+            return True
+        except OSError:
             print("Error saving high scores.")
             return False
-    
+            
+    def flush(self):
+        """Save scores to file if anything changed since the last save"""
+        if not self._dirty:
+            return True
+        if self._save_scores():
+            self._dirty = False
+            return True
+        return False
+        
     def update_high_score(self, game_mode, operation_type, difficulty, stats):
         """
         Update high score if current score is higher
@@ -93,67 +169,63 @@ class HighScoreManager:
             return None
             
         # Get operation name (e.g., "addition")
-        op_name = QuestionGenerator.get_operation_name(operation_type).lower().replace(" ", "_")
+        op_name = _op_key(operation_type)
         
         # Ensure adaptive difficulty is mapped to an actual difficulty (1-3)
         if difficulty > 3:
             difficulty = stats.get('average_difficulty', 1)
             
-        diff_key = f"difficulty_{difficulty}"
+        diff_key = _diff_key(difficulty)
             
         # Ensure structure exists
-        if op_name not in self.scores[game_mode]:
-            self.scores[game_mode][op_name] = {}
-            
-        if diff_key not in self.scores[game_mode][op_name]:
-            self.scores[game_mode][op_name][diff_key] = {
-                "score": 0, 
-                "date": "", 
-                "accuracy": 0,
-                "avg_time": 0
-            }
+        key = (game_mode, op_name, diff_key)
+        record = self._flat.get(key)
+        if record is None:
+            record = dict(_EMPTY_RECORD)
+            self.scores[game_mode].setdefault(op_name, {})[diff_key] = record
+            self._flat[key] = record
             
         # Check if new score is higher
-        prev_high_score = self.scores[game_mode][op_name][diff_key]["score"]
+        prev_high_score = record["score"]
         is_high_score = stats["total_score"] > prev_high_score
         
+        now = time.strftime("%Y-%m-%d %H:%M")
+        
         if is_high_score:
-            # Update high score
-            self.scores[game_mode][op_name][diff_key] = {
+            # Update high score in place (shared with the nested structure)
+            record.update({
                 "score": stats["total_score"],
-                "date": time.strftime("%Y-%m-%d %H:%M"),
+                "date": now,
                 "accuracy": stats["accuracy"],
                 "avg_time": stats["avg_time"]
-            }
+            })
             
-            # Save to file
-            self._save_scores()
-            
-        # Update last played and stats
+        # Update last played and stats (a finished game always counts
+        # towards games_played, so this block always changes)
         self.scores["last_played"] = {
             "operation": op_name,
             "difficulty": difficulty,
             "mode": game_mode,
-            "date": time.strftime("%Y-%m-%d %H:%M")
+            "date": now
         }
         
-        self.scores["stats"]["total_problems_solved"] += stats["total_rounds"]
-        self.scores["stats"]["total_time_played"] += stats["avg_time"] * stats["total_rounds"]
-        self.scores["stats"]["games_played"] += 1
+        totals = self.scores["stats"]
+        totals["total_problems_solved"] += stats["total_rounds"]
+        totals["total_time_played"] += stats["avg_time"] * stats["total_rounds"]
+        totals["games_played"] += 1
+        self._dirty = True
         
-        # Save updates
-        self._save_scores()
+        # Nothing is written here; the caller's flush() saves the changes
+        # (at most once per game, or at exit)
         
         return (is_high_score, prev_high_score)
         
     def get_high_score(self, game_mode, operation_type, difficulty):
         """Get high score for specified parameters"""
-        try:
-            op_name = QuestionGenerator.get_operation_name(operation_type).lower().replace(" ", "_")
-            diff_key = f"difficulty_{min(difficulty, 3)}"
-            return self.scores[game_mode][op_name][diff_key]
-        except KeyError:
-            return {"score": 0, "date": "", "accuracy": 0, "avg_time": 0}
+        record = self._flat.get((game_mode, _op_key(operation_type), _diff_key(min(difficulty, 3))))
+        if record is None:
+            return dict(_EMPTY_RECORD)
+        return record
             
     def get_all_high_scores(self):
         """Get all high scores"""
@@ -173,52 +245,57 @@ class HighScoreManager:
             operation_type: Operation to filter by (optional)
         """
         cli.clear_screen()
-        print("\n" + "=" * 60)
-        print("                   HIGH SCORES                   ")
-        print("=" * 60)
+        
+        # Collect all output lines and write them in one go
+        out = [
+            "\n" + "=" * 60,
+            "                   HIGH SCORES                   ",
+            "=" * 60
+        ]
         
         modes = ["normal_mode", "timed_mode"] if not game_mode else [game_mode]
         
         for mode in modes:
             mode_display = "NORMAL MODE" if mode == "normal_mode" else "TIMED MODE"
-            print(f"\n{mode_display}")
-            print("-" * len(mode_display))
+            out.append(f"\n{mode_display}")
+            out.append("-" * len(mode_display))
+            mode_scores = self.scores[mode]
             
             for op_num in range(1, 10):
                 if operation_type and op_num != operation_type:
                     continue
                     
-                op_name = QuestionGenerator.get_operation_name(op_num)
-                op_key = op_name.lower().replace(" ", "_")
+                op_scores = mode_scores.get(_OP_KEYS[op_num])
                 
-                if op_key in self.scores[mode]:
-                    print(f"\n{op_name}:")
+                if op_scores is not None:
+                    out.append(f"\n{_OP_NAMES[op_num]}:")
                     for diff in range(1, 4):
-                        diff_key = f"difficulty_{diff}"
-                        diff_name = ["Easy", "Medium", "Hard"][diff-1]
+                        score_data = op_scores.get(_DIFF_KEYS[diff])
                         
-                        if diff_key in self.scores[mode][op_key]:
-                            score_data = self.scores[mode][op_key][diff_key]
+                        if score_data is not None:
+                            diff_name = _DIFF_NAMES[diff]
                             if score_data["score"] > 0:
-                                print(f"  {diff_name}: {score_data['score']} points " + 
-                                      f"(Accuracy: {score_data['accuracy']:.1f}%, " + 
-                                      f"Avg Time: {score_data['avg_time']:.2f}s, " + 
-                                      f"Date: {score_data['date']})")
+                                out.append(f"  {diff_name}: {score_data['score']} points " + 
+                                           f"(Accuracy: {score_data['accuracy']:.1f}%, " + 
+                                           f"Avg Time: {score_data['avg_time']:.2f}s, " + 
+                                           f"Date: {score_data['date']})")
                             else:
-                                print(f"  {diff_name}: No score yet")
+                                out.append(f"  {diff_name}: No score yet")
         
         # Display overall statistics
-        print("\n" + "=" * 60)
-        print("OVERALL STATS")
-        print(f"Total problems solved: {self.scores['stats']['total_problems_solved']}")
-        print(f"Total time played: {self.scores['stats']['total_time_played'] / 60:.1f} minutes")
-        print(f"Games played: {self.scores['stats']['games_played']}")
-        
-        if self.scores['last_played']:
-            last = self.scores['last_played']
-            print(f"\nLast played: {last['operation'].replace('_', ' ').title()} " + 
-                  f"(Difficulty {last['difficulty']}) in {last['mode'].replace('_', ' ').title()} " + 
-                  f"on {last['date']}")
-        
-        print("\nPress Enter to continue...")
+        out.append("\n" + "=" * 60)
+        out.append("OVERALL STATS")
+        totals = self.scores['stats']
+        out.append(f"Total problems solved: {totals['total_problems_solved']}")
+        out.append(f"Total time played: {totals['total_time_played'] / 60:.1f} minutes")
+        out.append(f"Games played: {totals['games_played']}")
+        
+        last = self.scores['last_played']
+        if last:
+            out.append(f"\nLast played: {last['operation'].replace('_', ' ').title()} " + 
+                       f"(Difficulty {last['difficulty']}) in {last['mode'].replace('_', ' ').title()} " + 
+                       f"on {last['date']}")
+        
+        out.append("\nPress Enter to continue...")
+        sys.stdout.write("\n".join(out) + "\n")
         input()
@@ -1,11 +1,10 @@
 #!/usr/bin/env python3
 
 import random
-from datetime import datetime
 import os
+import sys
 import time
 import fractions
-from decimal import Decimal, getcontext
 
 # Import our advanced operations
 import operations
@@ -39,13 +38,26 @@ OPERATION_PERC = "percentages"
 OPERATION_EXP = "exponents"
 OPERATION_ARRAY = "arrays"
 
+# Single RNG instance with its method bound once for the question generators
+_rng = random.Random()
+_randint = _rng.randint
+
+# ANSI clear screen + cursor home; written directly instead of spawning 'clear'
+CLEAR_SEQUENCE = "\033[2J\033[H"
+
+# Legacy Windows consoles only honour ANSI escapes once VT mode is enabled,
+# which an empty os.system() call does as a side effect - do it once here
+if os.name == 'nt' and not IS_PYTHONISTA:
+    os.system('')
+
 
 def clear_screen():
     """Clear the terminal screen in a cross-platform way"""
     if IS_PYTHONISTA:
         console.clear()
     else:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
 
 
 def display_welcome():
@@ -101,14 +113,14 @@ def get_difficulty():
 def generate_addition_question(difficulty):
     """Generate an addition question based on difficulty"""
     if difficulty == 1:  # Easy
-        x = random.randint(1, 20)
-        y = random.randint(1, 20)
+        x = _randint(1, 20)
+        y = _randint(1, 20)
     elif difficulty == 2:  # Medium
-        x = random.randint(10, 99)
-        y = random.randint(10, 99)
+        x = _randint(10, 99)
+        y = _randint(10, 99)
     else:  # Hard
-        x = random.randint(100, 999)
-        y = random.randint(100, 999)
+        x = _randint(100, 999)
+        y = _randint(100, 999)
     
     question = f"{x} + {y}"
     answer = x + y
@@ -118,14 +130,14 @@ def generate_addition_question(difficulty):
 def generate_subtraction_question(difficulty):
     """Generate a subtraction question based on difficulty"""
     if difficulty == 1:  # Easy
-        y = random.randint(1, 10)
-        x = random.randint(y, 20)  # Ensure x >= y for positive result
+        y = _randint(1, 10)
+        x = _randint(y, 20)  # Ensure x >= y for positive result
     elif difficulty == 2:  # Medium
-        y = random.randint(10, 50)
-        x = random.randint(y, 99)
+        y = _randint(10, 50)
+        x = _randint(y, 99)
     else:  # Hard
-        y = random.randint(100, 500)
-        x = random.randint(y, 999)
+        y = _randint(100, 500)
+        x = _randint(y, 999)
     
     question = f"{x} - {y}"
     answer = x - y
@@ -135,14 +147,14 @@ def generate_subtraction_question(difficulty):
 def generate_multiplication_question(difficulty):
     """Generate a multiplication question based on difficulty"""
     if difficulty == 1:  # Easy
-        x = random.randint(1, 10)
-        y = random.randint(1, 10)
+        x = _randint(1, 10)
+        y = _randint(1, 10)
     elif difficulty == 2:  # Medium
-        x = random.randint(5, 20)
-        y = random.randint(5, 20)
+        x = _randint(5, 20)
+        y = _randint(5, 20)
     else:  # Hard
-        x = random.randint(10, 99)
-        y = random.randint(10, 30)
+        x = _randint(10, 99)
+        y = _randint(10, 30)
     
     question = f"{x} × {y}"
     answer = x * y
@@ -152,16 +164,16 @@ def generate_multiplication_question(difficulty):
 def generate_division_question(difficulty):
     """Generate a division question with whole number result"""
     if difficulty == 1:  # Easy
-        y = random.randint(1, 10)
-        multiple = random.randint(1, 10)
+        y = _randint(1, 10)
+        multiple = _randint(1, 10)
         x = y * multiple
     elif difficulty == 2:  # Medium
-        y = random.randint(2, 12)
-        multiple = random.randint(1, 20)
+        y = _randint(2, 12)
+        multiple = _randint(1, 20)
         x = y * multiple
     else:  # Hard
-        y = random.randint(2, 25)
-        multiple = random.randint(10, 40)
+        y = _randint(2, 25)
+        multiple = _randint(10, 40)
         x = y * multiple
     
     question = f"{x} ÷ {y}"
@@ -169,32 +181,30 @@ def generate_division_question(difficulty):
     return question, answer
 
 
+# Question generators indexed by operation type (1-8); 9 is the mixed challenge
+_QUESTION_GENERATORS = (
+    None,
+    generate_addition_question,
+    generate_subtraction_question,
+    generate_multiplication_question,
+    generate_division_question,
+    operations.generate_fraction_question,
+    operations.generate_percentage_question,
+    operations.generate_exponent_question,
+    operations.generate_array_question
+)
+
+
 def generate_question(operation_type, difficulty):
     """Generate a question based on operation type and difficulty"""
-    if operation_type == 1:  # Addition
-        return generate_addition_question(difficulty)
-    elif operation_type == 2:  # Subtraction
-        return generate_subtraction_question(difficulty)
-    elif operation_type == 3:  # Multiplication
-        return generate_multiplication_question(difficulty)
-    elif operation_type == 4:  # Division
-        return generate_division_question(difficulty)
-    elif operation_type == 5:  # Fractions
-        return operations.generate_fraction_question(difficulty)
-    elif operation_type == 6:  # Percentages
-        return operations.generate_percentage_question(difficulty)
-    elif operation_type == 7:  # Exponents
-        return operations.generate_exponent_question(difficulty)
-    elif operation_type == 8:  # Arrays
-        return operations.generate_array_question(difficulty)
-    elif operation_type == 9:  # Mixed challenge
+    if operation_type == 9:  # Mixed challenge
         # Choose a random operation, including advanced ones
-        random_op = random.randint(1, 8)  # All operation types
-        return generate_question(random_op, difficulty)
-    else:
+        operation_type = _randint(1, 8)  # All operation types
+    elif not 1 <= operation_type <= 8:
         # Default to addition if operation not implemented
         print("This operation is coming soon! Using addition for now.")
-        return generate_addition_question(difficulty)
+        operation_type = 1
+    return _QUESTION_GENERATORS[operation_type](difficulty)
 
 
 def calculate_score(is_correct, time_taken, difficulty, streak_count):
@@ -217,16 +227,57 @@ def calculate_score(is_correct, time_taken, difficulty, streak_count):
     return int(score)
 
 
+def check_answer(operation_type, user_answer, correct_answer):
+    """
+    Check a normalized user answer against the correct answer
+    
+    The operation type already tells us the answer format, so only the
+    matching comparison is run (whole number, fraction or decimal).
+    """
+    if user_answer is None:
+        return False
+        
+    if operation_type == 9:  # Mixed challenge - format depends on the question drawn
+        if isinstance(correct_answer, int):
+            operation_type = 1
+        elif '/' in correct_answer:
+            try:
+                return fractions.Fraction(user_answer) == fractions.Fraction(correct_answer)
+            except (ValueError, ZeroDivisionError):
+                return user_answer == correct_answer
+        else:
+            operation_type = 6
+            
+    if operation_type == 5:  # Fractions - play_round passes both answers as Fraction objects
+        return user_answer == correct_answer
+    elif operation_type in (6, 7, 8):  # Percentages, exponents, arrays - may be decimal
+        try:
+            # Allow small tolerance for floating point
+            return abs(float(user_answer) - float(correct_answer)) < 0.001
+        except ValueError:
+            return user_answer == correct_answer
+    else:  # Basic operations - whole numbers
+        return user_answer == str(correct_answer)
+
+
 def play_round(operation_type, difficulty, round_num, total_rounds, streak_count=0):
-    """Play a single round of the game"""
+    """
+    Play a single round of the game
+    
+    Returns:
+        Tuple of (is_correct, time_taken, question, user_answer, correct_answer, score)
+    """
     clear_screen()
     print(f"\nRound {round_num} of {total_rounds}")
     print(f"{'='*30}\n")
     
     question, correct_answer = generate_question(operation_type, difficulty)
+    if operation_type == 5:
+        # Parse the fraction answer once; it prints the same as the generated string
+        correct_answer = fractions.Fraction(correct_answer)
     
     print(f"Calculate: {question}")
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     # Get user's answer
     try:
@@ -239,7 +290,7 @@ def play_round(operation_type, difficulty, round_num, total_rounds, streak_count
                     num = int(parts[0].strip())
                     denom = int(parts[1].strip())
                     if denom != 0:  # Avoid division by zero
-                        user_answer = f"{num}/{denom}"
+                        user_answer = fractions.Fraction(num, denom)
                     else:
                         user_answer = None
                 else:
@@ -248,8 +299,7 @@ def play_round(operation_type, difficulty, round_num, total_rounds, streak_count
                 try:
                     # Try to convert input to fraction in lowest terms
                     decimal = float(user_input)
-                    frac = fractions.Fraction(decimal).limit_denominator(1000)
-                    user_answer = f"{frac.numerator}/{frac.denominator}" if frac.denominator != 1 else str(frac.numerator)
+                    user_answer = fractions.Fraction(decimal).limit_denominator(1000)
                 except ValueError:
                     user_answer = None
         elif operation_type == 6:  # Percentages
@@ -286,51 +336,21 @@ def play_round(operation_type, difficulty, round_num, total_rounds, streak_count
     except ValueError:
         user_answer = None
     
-    end_time = datetime.now()
-    time_taken = end_time - start_time
-    
-    # Check answer - compare as strings to handle fractions, decimals, etc.
-    # For fractions, normalize both sides to handle equivalent fractions
-    is_correct = False
+    time_taken = time.perf_counter() - start_time
     
-    if user_answer is not None:
-        # Try to normalize fractions for comparison
-        try:
-            # Convert both to fractions if possible
-            if '/' in str(user_answer) and '/' in str(correct_answer):
-                user_parts = str(user_answer).split('/')
-                correct_parts = str(correct_answer).split('/')
-                
-                if len(user_parts) == 2 and len(correct_parts) == 2:
-                    user_frac = fractions.Fraction(int(user_parts[0]), int(user_parts[1]))
-                    correct_frac = fractions.Fraction(int(correct_parts[0]), int(correct_parts[1]))
-                    is_correct = (user_frac == correct_frac)
-            # Handle float comparisons with small tolerance
-            elif '.' in str(user_answer) or '.' in str(correct_answer):
-                try:
-                    user_float = float(user_answer)
-                    correct_float = float(correct_answer)
-                    # Allow small tolerance for floating point
-                    is_correct = abs(user_float - correct_float) < 0.001
-                except ValueError:
-                    is_correct = False
-            else:
-                # Direct string comparison for integers and other formats
-                is_correct = (str(user_answer) == str(correct_answer))
-        except (ValueError, ZeroDivisionError):
-            # If any conversion fails, fall back to direct comparison
-            is_correct = (str(user_answer) == str(correct_answer))
+    # Check answer using the comparison suited to the operation's answer format
+    is_correct = check_answer(operation_type, user_answer, correct_answer)
     
     # Show result
     if is_correct:
         print(f"\n✓ Correct! The answer is {correct_answer}")
-        print(f"Time: {time_taken.total_seconds():.2f} seconds")
+        print(f"Time: {time_taken:.2f} seconds")
     else:
         print(f"\n✗ Incorrect. The correct answer is {correct_answer}")
-        print(f"Time: {time_taken.total_seconds():.2f} seconds")
+        print(f"Time: {time_taken:.2f} seconds")
     
     # Calculate score
-    score = calculate_score(is_correct, time_taken.total_seconds(), difficulty, streak_count)
+    score = calculate_score(is_correct, time_taken, difficulty, streak_count)
     
     # Display score if correct
     if is_correct:
@@ -339,29 +359,35 @@ def play_round(operation_type, difficulty, round_num, total_rounds, streak_count
     # Pause between rounds
     input("\nPress Enter to continue...")
     
-    return {
-        'correct': is_correct,
-        'time_taken': time_taken.total_seconds(),
-        'question': question,
-        'user_answer': user_answer,
-        'correct_answer': correct_answer,
-        'score': score
-    }
-
-
-def display_game_summary(results):
-    """Display a summary of game results"""
+    return is_correct, time_taken, question, user_answer, correct_answer, score
+
+
+def display_game_summary(corrects, times, scores, questions, user_answers, correct_answers):
+    """Display a summary of game results (one parallel list per result field)"""
     clear_screen()
     print("\n" + "="*50)
     print("GAME SUMMARY".center(50))
     print("="*50)
     
-    # Calculate stats
-    total_rounds = len(results)
-    correct_count = sum(1 for r in results if r['correct'])
+    # Calculate stats and format the question review in a single pass
+    total_rounds = len(corrects)
+    correct_count = 0
+    total_time = 0.0
+    total_score = 0
+    review_lines = []
+    
+    review = zip(corrects, times, scores, questions, user_answers, correct_answers)
+    for i, (correct, time_taken, score, question, user_answer, correct_answer) in enumerate(review, 1):
+        correct_count += correct
+        total_time += time_taken
+        total_score += score
+        
+        status = "✓" if correct else "✗"
+        review_lines.append(f"{i}. {status} {question} = {correct_answer}")
+        review_lines.append(f"   Your answer: {user_answer} ({time_taken:.2f}s)")
+        
     accuracy = (correct_count / total_rounds) * 100 if total_rounds > 0 else 0
-    avg_time = sum(r['time_taken'] for r in results) / total_rounds if total_rounds > 0 else 0
-    total_score = sum(r.get('score', 0) for r in results)
+    avg_time = total_time / total_rounds if total_rounds > 0 else 0
     
     # Display stats
     print(f"\nTotal Questions: {total_rounds}")
@@ -374,11 +400,9 @@ def display_game_summary(results):
     print("\n" + "-"*50)
     print("QUESTION REVIEW".center(50))
     print("-"*50)
-
-    for i, result in enumerate(results, 1):
-        status = "✓" if result['correct'] else "✗"
-        print(f"{i}. {status} {result['question']} = {result['correct_answer']}")
-        print(f"   Your answer: {result['user_answer']} ({result['time_taken']:.2f}s)")
+    
+    for line in review_lines:
+        print(line)
     print(f"Total Score: {total_score} points, {accuracy:.1f}%")
     
     print("\n" + "="*50)
@@ -413,17 +437,24 @@ def main():
         except ValueError:
             rounds = MAX_ROUNDS
         
-        # Initialize results storage and streak counter
-        results = []
+        # Initialize results storage (one list per result field) and streak counter
+        corrects, times, scores, questions, user_answers, correct_answers = [], [], [], [], [], []
         streak_count = 0
         
         # Play rounds
         for round_num in range(1, rounds + 1):
-            round_result = play_round(operation_type, difficulty, round_num, rounds, streak_count)
-            results.append(round_result)
+            is_correct, time_taken, question, user_answer, correct_answer, score = play_round(
+                operation_type, difficulty, round_num, rounds, streak_count
+            )
+            corrects.append(is_correct)
+            times.append(time_taken)
+            scores.append(score)
+            questions.append(question)
+            user_answers.append(user_answer)
+            correct_answers.append(correct_answer)
             
             # Update streak count
-            if round_result['correct']:
+            if is_correct:
                 streak_count += 1
                 if streak_count >= STREAK_BONUS_THRESHOLD and streak_count % STREAK_BONUS_THRESHOLD == 0:
                     print(f"\n🔥 {streak_count} ANSWER STREAK! 🔥")
@@ -436,9 +467,9 @@ def main():
             # Adjust difficulty if adaptive mode is on
             if adaptive_difficulty and round_num % 3 == 0:  # Check every 3 rounds
                 # Get the last 3 rounds or fewer if not enough
-                recent_results = results[-3:]
-                correct_count = sum(1 for r in recent_results if r['correct'])
-                avg_time = sum(r['time_taken'] for r in recent_results) / len(recent_results)
+                recent_times = times[-3:]
+                correct_count = sum(corrects[-3:])
+                avg_time = sum(recent_times) / len(recent_times)
                 
                 # Adjust difficulty based on performance
                 if correct_count == 3 and avg_time < 5.0:  # All correct and fast
@@ -451,7 +482,7 @@ def main():
                         print(f"\n⬇️ Difficulty adjusted to {['Easy', 'Medium', 'Hard'][difficulty-1]} to help you improve. ⬇️")
         
         # Show game summary
-        display_game_summary(results)
+        display_game_summary(corrects, times, scores, questions, user_answers, correct_answers)
         
         # Ask to play again
         print("\nWould you like to play again?")
@@ -1,188 +1,270 @@
 #!/usr/bin/env python3
 
+import heapq
+import math
 import random
-import fractions
-from decimal import Decimal, getcontext
 
-# Set decimal precision for percentage calculations
-getcontext().prec = 6
+# Generator-private RNG with its method bound once
+_RNG = random.Random()
+_choices = _RNG.choices
+
+# Random draws are served from small pre-drawn pools (one per range or
+# choice sequence), each refilled by a single _choices() call
+_POOL_SIZE = 256
+_int_pools = {}
+_choice_pools = {}
+
+# Draws whose bounds depend on earlier draws would each leave a pool
+# behind (and draw a whole pool for one value), so they use the RNG directly
+rand_between = _RNG.randint
+
+
+def rand_int(low, high):
+    """
+    Return a random integer N such that low <= N <= high
+    
+    Only for fixed ranges - use rand_between for data-dependent bounds.
+    """
+    pool = _int_pools.get((low, high))
+    if not pool:
+        pool = _int_pools[(low, high)] = _choices(range(low, high + 1), k=_POOL_SIZE)
+    return pool.pop()
+
+
+def rand_choice(seq):
+    """Return a random element of seq (which must be hashable, e.g. a tuple)"""
+    pool = _choice_pools.get(seq)
+    if not pool:
+        pool = _choice_pools[seq] = _choices(seq, k=_POOL_SIZE)
+    return pool.pop()
+
+
+# Operator signs shown in questions
+MUL_SIGN = "×"
+DIV_SIGN = "÷"
+
+# Choice sequences used by the question generators
+_FRAC_OPERATIONS = ('+', '-', MUL_SIGN, DIV_SIGN)
+_FRAC_DENOMS_EASY = (2, 3, 4, 5)
+_FRAC_DENOMS_MEDIUM = (4, 5, 6, 8, 10)
+_FRAC_DENOMS_HARD = (6, 8, 9, 12, 15, 16)
+_PCT_OF_EASY = (10, 25, 50, 75, 100)
+_PCT_WHAT_EASY = (10, 20, 25, 50, 75)
+_PCT_ADD_EASY = (5, 10, 25, 50, 100)
+_EXP_OPS_EASY = ('square', 'cube', 'square_root_perfect')
+_EXP_OPS_MEDIUM = ('square', 'cube', 'power', 'square_root')
+_EXP_OPS_HARD = ('power', 'power_fraction', 'root', 'combined')
+
+
+def reduce_fraction(num, denom):
+    """
+    Reduce num/denom to lowest terms with the sign on the numerator
+    
+    Returns:
+        Tuple of (numerator, denominator)
+    """
+    g = math.gcd(num, denom)
+    if denom < 0:
+        g = -g
+    return num // g, denom // g
+
 
 def generate_fraction_question(difficulty):
     """Generate a fraction operation question based on difficulty"""
-    operation = random.choice(['+', '-', '×', '÷'])
+    operation = rand_choice(_FRAC_OPERATIONS)
     
     if difficulty == 1:  # Easy
         # Use fractions with small denominators
-        denom1 = random.choice([2, 3, 4, 5])
-        denom2 = random.choice([2, 3, 4, 5])
-        num1 = random.randint(1, denom1-1)
-        num2 = random.randint(1, denom2-1)
+        denom1 = rand_choice(_FRAC_DENOMS_EASY)
+        denom2 = rand_choice(_FRAC_DENOMS_EASY)
+        num1 = rand_between(1, denom1-1)
+        num2 = rand_between(1, denom2-1)
     elif difficulty == 2:  # Medium
-        denom1 = random.choice([4, 5, 6, 8, 10])
-        denom2 = random.choice([4, 5, 6, 8, 10])
-        num1 = random.randint(1, denom1)
-        num2 = random.randint(1, denom2)
+        denom1 = rand_choice(_FRAC_DENOMS_MEDIUM)
+        denom2 = rand_choice(_FRAC_DENOMS_MEDIUM)
+        num1 = rand_between(1, denom1)
+        num2 = rand_between(1, denom2)
     else:  # Hard
-        denom1 = random.choice([6, 8, 9, 12, 15, 16])
-        denom2 = random.choice([6, 8, 9, 12, 15, 16])
-        num1 = random.randint(1, denom1*2)
-        num2 = random.randint(1, denom2)
-    
-    # Create fraction objects
-    frac1 = fractions.Fraction(num1, denom1)
-    frac2 = fractions.Fraction(num2, denom2)
+        denom1 = rand_choice(_FRAC_DENOMS_HARD)
+        denom2 = rand_choice(_FRAC_DENOMS_HARD)
+        num1 = rand_between(1, denom1*2)
+        num2 = rand_between(1, denom2)
     
     # Format question string with proper fraction notation
     question = f"{num1}/{denom1} {operation} {num2}/{denom2}"
     
-    # Calculate answer based on operation
+    # Work on raw (numerator, denominator) ints and reduce once at the end
     if operation == '+':
-        answer = frac1 + frac2
+        num = num1 * denom2 + num2 * denom1
+        denom = denom1 * denom2
     elif operation == '-':
         # Swap if needed to ensure positive result for easier problems
-        if difficulty < 3 and frac2 > frac1:
-            frac1, frac2 = frac2, frac1
-            question = f"{frac1.numerator}/{frac1.denominator} - {frac2.numerator}/{frac2.denominator}"
-        answer = frac1 - frac2
-    elif operation == '×':
-        answer = frac1 * frac2
-    elif operation == '÷':
+        # (compared by cross-multiplying, denominators are positive)
+        if difficulty < 3 and num2 * denom1 > num1 * denom2:
+            num1, denom1, num2, denom2 = num2, denom2, num1, denom1
+            question = f"{num1}/{denom1} - {num2}/{denom2}"
+        num = num1 * denom2 - num2 * denom1
+        denom = denom1 * denom2
+    elif operation == MUL_SIGN:
+        num = num1 * num2
+        denom = denom1 * denom2
+    else:  # DIV_SIGN
         # Avoid division by zero
-        if frac2.numerator == 0:
-            frac2 = fractions.Fraction(1, denom2)
+        if num2 == 0:
+            num2 = 1
             question = f"{num1}/{denom1} {operation} 1/{denom2}"
-        answer = frac1 / frac2
+        num = num1 * denom2
+        denom = denom1 * num2
+        
+    num, denom = reduce_fraction(num, denom)
     
     # Convert answer to string representation
-    if answer.denominator == 1:
-        answer_str = str(answer.numerator)
+    if denom == 1:
+        answer_str = str(num)
     else:
-        answer_str = f"{answer.numerator}/{answer.denominator}"
+        answer_str = f"{num}/{denom}"
     
     return question, answer_str
 
 
+def _percent_of(percentage, number):
+    """
+    Exact percentage of an integer for the easy questions
+    
+    Integer arithmetic gives an int whenever the result is whole; otherwise
+    a single division (at most one decimal place for the easy values) is
+    returned without needing round().
+    """
+    product = percentage * number
+    if product % 100 == 0:
+        return product // 100
+    return product / 100
+
+
 def generate_percentage_question(difficulty):
     """Generate a percentage-based question"""
-    q_type = random.randint(1, 3)
+    q_type = rand_int(1, 3)
     
     if difficulty == 1:  # Easy
         # Find X% of Y
         if q_type == 1:
-            percentage = random.choice([10, 25, 50, 75, 100])
-            number = random.randint(1, 100) * 4  # Multiple of 4 for easier calculations
-            answer = (percentage / 100) * number
+            percentage = rand_choice(_PCT_OF_EASY)
+            number = rand_int(1, 100) * 4  # Multiple of 4 for easier calculations
+            answer = _percent_of(percentage, number)
             question = f"What is {percentage}% of {number}?"
         # X is what % of Y
         elif q_type == 2:
-            y = random.randint(5, 10) * 10  # 50, 60, ..., 100
-            percentage = random.choice([10, 20, 25, 50, 75])
+            y = rand_int(5, 10) * 10  # 50, 60, ..., 100
+            percentage = rand_choice(_PCT_WHAT_EASY)
             x = int((percentage / 100) * y)
             question = f"{x} is what percent of {y}?"
             answer = percentage
         # X + Y%
         else:
-            number = random.randint(10, 100) * 10  # 100, 200, ..., 1000
-            percentage = random.choice([5, 10, 25, 50, 100])
-            answer = number * (1 + percentage/100)
+            number = rand_int(10, 100) * 10  # 100, 200, ..., 1000
+            percentage = rand_choice(_PCT_ADD_EASY)
+            answer = number + _percent_of(percentage, number)
             question = f"{number} + {percentage}%"
     
     elif difficulty == 2:  # Medium
         # Find X% of Y
         if q_type == 1:
-            percentage = random.randint(1, 99)
-            number = random.randint(1, 200)
-            answer = (percentage / 100) * number
+            percentage = rand_int(1, 99)
+            number = rand_int(1, 200)
+            answer = round((percentage / 100) * number, 2)
             question = f"What is {percentage}% of {number}?"
         # X is what % of Y
         elif q_type == 2:
-            y = random.randint(50, 200)
-            x = random.randint(5, y)
+            y = rand_int(50, 200)
+            x = rand_between(5, y)
             percentage = round((x / y) * 100, 1)
             question = f"{x} is what percent of {y}?"
             answer = percentage
         # X + Y%
         else:
-            number = random.randint(100, 500)
-            percentage = random.randint(1, 40)
-            answer = number * (1 + percentage/100)
+            number = rand_int(100, 500)
+            percentage = rand_int(1, 40)
+            answer = round(number * (1 + percentage/100), 2)
             question = f"{number} + {percentage}%"
             
     else:  # Hard
         # Find X% of Y with complex numbers
         if q_type == 1:
-            percentage = random.randint(1, 999) / 10  # Allow decimals
-            number = random.randint(100, 500)
-            answer = (percentage / 100) * number
+            percentage = rand_int(1, 999) / 10  # Allow decimals
+            number = rand_int(100, 500)
+            answer = round((percentage / 100) * number, 2)
             question = f"What is {percentage}% of {number}?"
         # X is what % of Y with challenging numbers
         elif q_type == 2:
-            y = random.randint(50, 500)
-            x = random.randint(1, y)
+            y = rand_int(50, 500)
+            x = rand_between(1, y)
             percentage = round((x / y) * 100, 2)
             question = f"{x} is what percent of {y}?"
             answer = percentage
         # X - Y%
         else:
-            number = random.randint(500, 1000)
-            percentage = random.randint(1, 75)
-            answer = number * (1 - percentage/100)
+            number = rand_int(500, 1000)
+            percentage = rand_int(1, 75)
+            answer = round(number * (1 - percentage/100), 2)
             question = f"{number} - {percentage}%"
     
-    # Round the answer to 2 decimal places if it's a float
-    if isinstance(answer, float):
-        answer = round(answer, 2)
-    
     return question, str(answer)
 
 
+# Perfect power tables for the square/cube/root questions
+_SQUARES = tuple(i * i for i in range(32))
+_CUBES = tuple(i * i * i for i in range(16))
+_SQRT_PERFECT = tuple((root, root * root) for root in range(2, 11))  # (root, square) pairs
+
+
 def generate_exponent_question(difficulty):
     """Generate exponentiation and root questions"""
     # Choose operation type based on difficulty
     if difficulty == 1:  # Easy
-        op_type = random.choice(['square', 'cube', 'square_root_perfect'])
+        op_type = rand_choice(_EXP_OPS_EASY)
     elif difficulty == 2:  # Medium
-        op_type = random.choice(['square', 'cube', 'power', 'square_root'])
+        op_type = rand_choice(_EXP_OPS_MEDIUM)
     else:  # Hard
-        op_type = random.choice(['power', 'power_fraction', 'root', 'combined'])
+        op_type = rand_choice(_EXP_OPS_HARD)
     
     # Generate question based on operation type
     if op_type == 'square':
-        base = random.randint(2, 15 if difficulty == 1 else 25)
+        base = rand_int(2, 15 if difficulty == 1 else 25)
         question = f"{base}²"
-        answer = base ** 2
+        answer = _SQUARES[base]
         
     elif op_type == 'cube':
-        base = random.randint(2, 10 if difficulty == 1 else 15)
+        base = rand_int(2, 10 if difficulty == 1 else 15)
         question = f"{base}³"
-        answer = base ** 3
+        answer = _CUBES[base]
         
     elif op_type == 'power':
-        base = random.randint(2, 6 if difficulty == 2 else 10)
-        exponent = random.randint(2, 4 if difficulty == 2 else 6)
+        base = rand_int(2, 6 if difficulty == 2 else 10)
+        exponent = rand_int(2, 4 if difficulty == 2 else 6)
         question = f"{base}^{exponent}"
         answer = base ** exponent
         
     elif op_type == 'power_fraction':
-        base = random.randint(2, 10) ** 2  # Perfect square
-        exponent = fractions.Fraction(1, 2)
+        # Draw the root and square it, so the answer is exact by construction
+        answer = rand_int(2, 10)
+        base = _SQUARES[answer]  # Perfect square
         question = f"{base}^(1/2)"
-        answer = int(base ** 0.5)
         
     elif op_type == 'square_root_perfect':
-        result = random.randint(2, 10)
-        number = result * result
+        result, number = rand_choice(_SQRT_PERFECT)
         question = f"√{number}"
         answer = result
         
     elif op_type == 'square_root':
-        number = random.randint(2, 100)
+        number = rand_int(2, 100)
         question = f"√{number}"
-        answer = round(number ** 0.5, 3)
+        answer = round(math.sqrt(number), 3)
+        if answer.is_integer():
+            answer = int(answer)
         
     elif op_type == 'root':
-        root = random.randint(2, 3)
-        result = random.randint(2, 5)
+        root = rand_int(2, 3)
+        result = rand_int(2, 5)
         number = result ** root
         if root == 2:
             question = f"√{number}"
@@ -193,90 +275,112 @@ def generate_exponent_question(difficulty):
         answer = result
         
     elif op_type == 'combined':
-        base = random.randint(2, 5)
-        exp1 = random.randint(2, 3)
-        exp2 = random.randint(2, 3)
-        question = f"{base}^{exp1} × {base}^{exp2}"
+        base = rand_int(2, 5)
+        exp1 = rand_int(2, 3)
+        exp2 = rand_int(2, 3)
+        question = f"{base}^{exp1} {MUL_SIGN} {base}^{exp2}"
         answer = base ** (exp1 + exp2)
     
-    # Ensure the answer is properly formatted
-    if isinstance(answer, float) and answer.is_integer():
-        answer = int(answer)
-    if isinstance(answer, float):
-        answer = round(answer, 3)
-    
     return question, str(answer)
 
 
+# Array question settings per difficulty:
+# (array size range, element value range, operation types)
+_ARRAY_SETTINGS = {
+    1: ((3, 5), (1, 10), ('sum', 'max', 'min', 'mean')),
+    2: ((5, 8), (1, 20), ('sum', 'max', 'min', 'mean', 'median', 'product_first_n')),
+    3: ((6, 10), (-10, 30), ('sum', 'max', 'min', 'mean', 'median', 'product_first_n', 'sum_even', 'sum_odd'))
+}
+
+# Question text for each array operation type (product_first_n adds the count)
+_ARRAY_QUESTION_PREFIXES = {
+    'sum': "Sum of",
+    'max': "Max value in",
+    'min': "Min value in",
+    'mean': "Mean (average) of",
+    'median': "Median of",
+    'product_first_n': "Product of first {n} elements in",
+    'sum_even': "Sum of even values in",
+    'sum_odd': "Sum of odd values in"
+}
+
+
 def generate_array_question(difficulty):
     """Generate questions about array operations"""
-    # Define array size based on difficulty
-    if difficulty == 1:  # Easy
-        size = random.randint(3, 5)
-        elements = [random.randint(1, 10) for _ in range(size)]
-    elif difficulty == 2:  # Medium
-        size = random.randint(5, 8)
-        elements = [random.randint(1, 20) for _ in range(size)]
-    else:  # Hard
-        size = random.randint(6, 10)
-        elements = [random.randint(-10, 30) for _ in range(size)]
-    
-    # Choose operation type
-    if difficulty == 1:
-        op_type = random.choice(['sum', 'max', 'min', 'mean'])
-    elif difficulty == 2:
-        op_type = random.choice(['sum', 'max', 'min', 'mean', 'median', 'product_first_n'])
-    else:
-        op_type = random.choice(['sum', 'max', 'min', 'mean', 'median', 'product_first_n', 'sum_even', 'sum_odd'])
-    
-    # Format array for display
-    array_str = "[" + ", ".join(str(x) for x in elements) + "]"
-    
-    # Generate question and answer based on operation type
-    if op_type == 'sum':
-        question = f"Sum of {array_str}"
-        answer = sum(elements)
-        
-    elif op_type == 'max':
-        question = f"Max value in {array_str}"
-        answer = max(elements)
-        
-    elif op_type == 'min':
-        question = f"Min value in {array_str}"
-        answer = min(elements)
-        
-    elif op_type == 'mean':
-        question = f"Mean (average) of {array_str}"
-        answer = round(sum(elements) / len(elements), 2)
-        
-    elif op_type == 'median':
-        question = f"Median of {array_str}"
-        sorted_elements = sorted(elements)
-        mid = len(sorted_elements) // 2
-        if len(sorted_elements) % 2 == 0:
-            answer = (sorted_elements[mid-1] + sorted_elements[mid]) / 2
+    (size_min, size_max), (low, high), op_types = _ARRAY_SETTINGS.get(difficulty, _ARRAY_SETTINGS[3])
+    size = rand_int(size_min, size_max)
+    elements = [rand_int(low, high) for _ in range(size)]
+    return _array_question(elements, rand_choice(op_types))
+
+
+def _even_odd_sums(elements):
+    """Return (sum of even values, sum of odd values) in a single pass"""
+    even_sum = odd_sum = 0
+    for x in elements:
+        if x & 1:  # Also correct for negative ints
+            odd_sum += x
         else:
-            answer = sorted_elements[mid]
-        if isinstance(answer, float) and answer.is_integer():
-            answer = int(answer)
-        
-    elif op_type == 'product_first_n':
-        n = random.randint(2, min(4, len(elements)))
-        question = f"Product of first {n} elements in {array_str}"
-        answer = 1
-        for i in range(n):
-            answer *= elements[i]
-        
-    elif op_type == 'sum_even':
-        question = f"Sum of even values in {array_str}"
-        answer = sum(x for x in elements if x % 2 == 0)
-        
-    elif op_type == 'sum_odd':
-        question = f"Sum of odd values in {array_str}"
-        answer = sum(x for x in elements if x % 2 != 0)
-    
-    # Ensure the answer is properly formatted
+            even_sum += x
+    return even_sum, odd_sum
+
+
+def _array_mean(elements):
+    """Mean of the array rounded to 2 decimal places"""
+    answer = round(sum(elements) / len(elements), 2)
+    if answer.is_integer():
+        answer = int(answer)
+    return answer
+
+
+def _array_median(elements):
+    """Median of the array"""
+    # Only the lower half (plus the middle) needs ordering
+    size = len(elements)
+    smallest = heapq.nsmallest(size // 2 + 1, elements)
+    if size % 2 == 0:
+        answer = (smallest[-2] + smallest[-1]) / 2
+    else:
+        answer = smallest[-1]
     if isinstance(answer, float) and answer.is_integer():
         answer = int(answer)
+    return answer
+
+
+def _array_sum_even(elements):
+    """Sum of the even values in the array"""
+    return _even_odd_sums(elements)[0]
+
+
+def _array_sum_odd(elements):
+    """Sum of the odd values in the array"""
+    return _even_odd_sums(elements)[1]
+
+
+# Numeric reduction for each array operation type (product_first_n is
+# handled by _array_question since it also draws the element count)
+_ARRAY_REDUCERS = {
+    'sum': sum,
+    'max': max,
+    'min': min,
+    'mean': _array_mean,
+    'median': _array_median,
+    'sum_even': _array_sum_even,
+    'sum_odd': _array_sum_odd
+}
+
+
+def _array_question(elements, op_type):
+    """Build the question and answer string for one array and operation type"""
+    # Format array for display
+    array_str = f"[{', '.join(map(str, elements))}]"
+    prefix = _ARRAY_QUESTION_PREFIXES[op_type]
     
-    return question, str(answer)
+    # Compute the answer based on operation type
+    if op_type == 'product_first_n':
+        n = rand_between(2, min(4, len(elements)))
+        prefix = prefix.format(n=n)
+        answer = math.prod(elements[:n])
+    else:
+        answer = _ARRAY_REDUCERS[op_type](elements)
+    
+    return f"{prefix} {array_str}", str(answer)
@@ -1,12 +1,9 @@
 #!/usr/bin/env python3
 
-import random
-import fractions
-from decimal import Decimal, getcontext
-import operations
+from fractions import Fraction
 
-# Set decimal precision for percentage calculations
-getcontext().prec = 6
+import operations
+from operations import DIV_SIGN, MUL_SIGN, rand_int, rand_between
 
 # Operation type constants
 OPERATION_ADD = 1
@@ -25,61 +22,49 @@ class QuestionGenerator:
     Class to handle generation of math questions of various types and difficulty levels
     """
     
-    @staticmethod
-    def get_operation_name(operation_type):
+    # Display names keyed by operation type
+    _OP_NAMES = {
+        OPERATION_ADD: "Addition",
+        OPERATION_SUB: "Subtraction",
+        OPERATION_MUL: "Multiplication",
+        OPERATION_DIV: "Division",
+        OPERATION_FRAC: "Fractions",
+        OPERATION_PERC: "Percentages",
+        OPERATION_EXP: "Exponents",
+        OPERATION_ARRAY: "Arrays",
+        OPERATION_MIXED: "Mixed Challenge"
+    }
+    
+    @classmethod
+    def get_operation_name(cls, operation_type):
         """Return the name of the operation type"""
-        operations_map = {
-            OPERATION_ADD: "Addition",
-            OPERATION_SUB: "Subtraction",
-            OPERATION_MUL: "Multiplication",
-            OPERATION_DIV: "Division",
-            OPERATION_FRAC: "Fractions",
-            OPERATION_PERC: "Percentages",
-            OPERATION_EXP: "Exponents",
-            OPERATION_ARRAY: "Arrays",
-            OPERATION_MIXED: "Mixed Challenge"
-        }
-        return operations_map.get(operation_type, "Unknown")
+        return cls._OP_NAMES.get(operation_type, "Unknown")
     
     @staticmethod
     def generate_question(operation_type, difficulty):
         """Generate a question based on operation type and difficulty"""
-        if operation_type == OPERATION_ADD:
-            return QuestionGenerator.generate_addition_question(difficulty)
-        elif operation_type == OPERATION_SUB:
-            return QuestionGenerator.generate_subtraction_question(difficulty)
-        elif operation_type == OPERATION_MUL:
-            return QuestionGenerator.generate_multiplication_question(difficulty)
-        elif operation_type == OPERATION_DIV:
-            return QuestionGenerator.generate_division_question(difficulty)
-        elif operation_type == OPERATION_FRAC:
-            return operations.generate_fraction_question(difficulty)
-        elif operation_type == OPERATION_PERC:
-            return operations.generate_percentage_question(difficulty)
-        elif operation_type == OPERATION_EXP:
-            return operations.generate_exponent_question(difficulty)
-        elif operation_type == OPERATION_ARRAY:
-            return operations.generate_array_question(difficulty)
-        elif operation_type == OPERATION_MIXED:
-            # For mixed challenge, pick a random operation type
-            random_op = random.randint(1, 8)
-            return QuestionGenerator.generate_question(random_op, difficulty)
-        else:
-            print("This operation is coming soon! Using addition for now.")
-            return QuestionGenerator.generate_addition_question(difficulty)
+        generator = QuestionGenerator._DISPATCH.get(operation_type)
+        if generator is None:
+            if operation_type == OPERATION_MIXED:
+                # For mixed challenge, pick a random concrete generator
+                generator = QuestionGenerator._MIXED_OPS[rand_int(0, 7)]
+            else:
+                print("This operation is coming soon! Using addition for now.")
+                generator = QuestionGenerator._DISPATCH[OPERATION_ADD]
+        return generator(difficulty)
 
     @staticmethod
     def generate_addition_question(difficulty):
         """Generate an addition question based on difficulty"""
         if difficulty == 1:  # Easy
-            num1 = random.randint(1, 20)
-            num2 = random.randint(1, 20)
+            num1 = rand_int(1, 20)
+            num2 = rand_int(1, 20)
         elif difficulty == 2:  # Medium
-            num1 = random.randint(10, 100)
-            num2 = random.randint(10, 100)
+            num1 = rand_int(10, 100)
+            num2 = rand_int(10, 100)
         else:  # Hard
-            num1 = random.randint(50, 500)
-            num2 = random.randint(50, 500)
+            num1 = rand_int(50, 500)
+            num2 = rand_int(50, 500)
         
         question = f"{num1} + {num2}"
         answer = num1 + num2
@@ -89,14 +74,14 @@ class QuestionGenerator:
     def generate_subtraction_question(difficulty):
         """Generate a subtraction question based on difficulty"""
         if difficulty == 1:  # Easy
-            num2 = random.randint(1, 10)
-            num1 = random.randint(num2, 20)  # Ensure positive result
+            num2 = rand_int(1, 10)
+            num1 = rand_between(num2, 20)  # Ensure positive result
         elif difficulty == 2:  # Medium
-            num2 = random.randint(10, 50)
-            num1 = random.randint(num2, 100)
+            num2 = rand_int(10, 50)
+            num1 = rand_between(num2, 100)
         else:  # Hard
-            num2 = random.randint(50, 200)
-            num1 = random.randint(num2, 500)
+            num2 = rand_int(50, 200)
+            num1 = rand_between(num2, 500)
             
         question = f"{num1} - {num2}"
         answer = num1 - num2
@@ -106,16 +91,16 @@ class QuestionGenerator:
     def generate_multiplication_question(difficulty):
         """Generate a multiplication question based on difficulty"""
         if difficulty == 1:  # Easy
-            num1 = random.randint(1, 10)
-            num2 = random.randint(1, 10)
+            num1 = rand_int(1, 10)
+            num2 = rand_int(1, 10)
         elif difficulty == 2:  # Medium
-            num1 = random.randint(2, 12)
-            num2 = random.randint(11, 30)
+            num1 = rand_int(2, 12)
+            num2 = rand_int(11, 30)
         else:  # Hard
-            num1 = random.randint(11, 30)
-            num2 = random.randint(11, 30)
+            num1 = rand_int(11, 30)
+            num2 = rand_int(11, 30)
             
-        question = f"{num1} × {num2}"
+        question = f"{num1} {MUL_SIGN} {num2}"
         answer = num1 * num2
         return question, str(answer)
 
@@ -123,20 +108,22 @@ class QuestionGenerator:
     def generate_division_question(difficulty):
         """Generate a division question based on difficulty"""
         if difficulty == 1:  # Easy - result is an integer
-            divisor = random.randint(1, 10)
-            result = random.randint(1, 10)
+            divisor = rand_int(1, 10)
+            result = rand_int(1, 10)
             dividend = divisor * result
         elif difficulty == 2:  # Medium - may have remainders
-            divisor = random.randint(2, 15)
-            dividend = random.randint(20, 150)
-            # Adjust to avoid complex decimals
-            if dividend % divisor != 0 and random.choice([True, False]):
-                dividend = (dividend // divisor) * divisor
+            divisor = rand_int(2, 15)
+            # Half the time draw an exact multiple of the divisor (still 20-150)
+            # to avoid complex decimals, otherwise any dividend in range
+            if rand_int(0, 1):
+                dividend = divisor * rand_between((20 + divisor - 1) // divisor, 150 // divisor)
+            else:
+                dividend = rand_int(20, 150)
         else:  # Hard - larger numbers
-            divisor = random.randint(5, 25)
-            dividend = random.randint(100, 500)
+            divisor = rand_int(5, 25)
+            dividend = rand_int(100, 500)
             
-        question = f"{dividend} ÷ {divisor}"
+        question = f"{dividend} {DIV_SIGN} {divisor}"
         
         # Calculate answer, format as float or integer as appropriate
         result = dividend / divisor
@@ -152,14 +139,22 @@ class QuestionGenerator:
     def normalize_answer(answer_str):
         """
         Normalize answer string to handle different formats
+        
+        Fractions come back as a Fraction, or as an int if they reduce to a
+        whole number, so they still compare equal to other numeric forms.
         """
         # Handle fractions
         if '/' in answer_str:
             try:
                 num, denom = map(int, answer_str.split('/'))
-                return fractions.Fraction(num, denom)
-            except (ValueError, ZeroDivisionError):
+            except ValueError:
+                return answer_str
+            if denom == 0:
                 return answer_str
+            value = Fraction(num, denom)
+            if value.denominator == 1:
+                return value.numerator
+            return value
                 
         # Handle decimal numbers
         try:
@@ -170,3 +165,19 @@ class QuestionGenerator:
             return value
         except ValueError:
             return answer_str
+
+    # Question generators keyed by operation type
+    _DISPATCH = {
+        OPERATION_ADD: generate_addition_question.__func__,
+        OPERATION_SUB: generate_subtraction_question.__func__,
+        OPERATION_MUL: generate_multiplication_question.__func__,
+        OPERATION_DIV: generate_division_question.__func__,
+        OPERATION_FRAC: operations.generate_fraction_question,
+        OPERATION_PERC: operations.generate_percentage_question,
+        OPERATION_EXP: operations.generate_exponent_question,
+        OPERATION_ARRAY: operations.generate_array_question
+    }
+    
+    # The eight concrete generators in operation order, indexed directly
+    # by the mixed challenge
+    _MIXED_OPS = tuple(_DISPATCH.values())
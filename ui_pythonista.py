@@ -14,12 +14,17 @@ except ImportError:
     PYTHONISTA_AVAILABLE = False
     print("Pythonista UI modules not available. This module requires Pythonista on iOS.")
     
+import math
 import time
 from datetime import datetime
-import threading
-from questions import QuestionGenerator, OPERATION_MIXED
-from game import MathGame
-from high_scores import HighScoreManager
+from functools import partial
+
+# The game modules are only needed to run the UI; a headless import (e.g. to
+# check what the module defines) skips them and HighScoreManager's file I/O
+if PYTHONISTA_AVAILABLE:
+    from questions import QuestionGenerator, OPERATION_MIXED
+    from game import MathGame
+    from high_scores import HighScoreManager
 
 # Constants
 TINT_COLOR = '#007aff'  # iOS blue tint color
@@ -28,12 +33,107 @@ CORRECT_COLOR = '#34c759'  # iOS green
 INCORRECT_COLOR = '#ff3b30'  # iOS red
 LIGHT_GRAY = '#e5e5ea'  # iOS light gray
 
+# Fonts shared by all screens
+_FONT_TITLE_LG = ('Helvetica-Bold', 28)
+_FONT_TITLE = ('Helvetica-Bold', 24)
+_FONT_BODY_BOLD = ('Helvetica-Bold', 18)
+_FONT_INPUT = ('Helvetica', 20)
+_FONT_BODY_LG = ('Helvetica', 18)
+_FONT_BODY_MD = ('Helvetica', 17)
+_FONT_BODY = ('Helvetica', 16)
+_FONT_STATUS = ('Helvetica-Bold', 80)  # Result ✓/✗ symbols
+
+# Bound formatters for the timed challenge labels, updated on every tick/answer
+_TIMER_FMT = 'Time: {}s'.format
+_SCORE_FMT = 'Score: {} | Solved: {}'.format
+_QUESTION_FMT = 'Calculate: {}'.format
+
+# Timed challenge summary stats (one line each)
+_SUMMARY_TMPL = (
+    "Questions Attempted: {attempted}\n"
+    "Correct Answers: {correct}\n"
+    "Accuracy: {acc:.1f}%\n"
+    "Questions Per Minute: {qpm:.1f}\n"
+    "Total Score: {score} points"
+)
+
+# Menu options as (name, id) pairs, in display order
+_OPERATIONS = (
+    ("Addition", 1),
+    ("Subtraction", 2),
+    ("Multiplication", 3),
+    ("Division", 4),
+    ("Fractions", 5),
+    ("Percentages", 6),
+    ("Exponents", 7),
+    ("Arrays", 8),
+    ("Mixed Challenge", 9)
+)
+_DIFFICULTIES = (
+    ("Easy", 1),
+    ("Medium", 2),
+    ("Hard", 3),
+    ("Adaptive", 4)
+)
+# Timed challenge limits as (seconds, button title) pairs
+_TIMED_PRESET_BUTTONS = (
+    (30, "30s"),
+    (60, "1m"),
+    (120, "2m"),
+    (180, "3m"),
+    (300, "5m")
+)
+
+# Note: screens are built from plain ui.View instances on purpose - a View
+# subclass with a draw() override gets its own backing bitmap per instance.
+# Custom graphics (like the result symbols) are rendered once into images.
+
+
+def _render_status_image(symbol, color):
+    """Render a large status symbol (✓/✗) into a reusable image"""
+    with ui.ImageContext(200, 100) as ctx:
+        ui.draw_string(symbol, rect=(0, 0, 200, 100), font=_FONT_STATUS,
+                       color=color, alignment=ui.ALIGN_CENTER)
+        return ctx.get_image()
+
+
+if PYTHONISTA_AVAILABLE:
+    _CHECK_IMG = _render_status_image('✓', CORRECT_COLOR)
+    _CROSS_IMG = _render_status_image('✗', INCORRECT_COLOR)
+
+
+def _format_score_row(score):
+    """Format a high score entry as a table row"""
+    return {
+        'title': f"{score['operation']} - {score['difficulty']}",
+        'subtitle': f"Score: {score['score']} | Accuracy: {score['accuracy']:.1f}% | Time: {score['avg_time']:.2f}s",
+        'accessory_type': 'detail_button'
+    }
+
+
+class _OpPickerDelegate:
+    """Data source and delegate for the operation picker"""
+    
+    def __init__(self, items):
+        self.items = items
+    
+    def pickerView_numberOfRowsInComponent_(self, picker_view, component):
+        return len(self.items)
+    
+    def pickerView_titleForRow_forComponent_(self, picker_view, row, component):
+        return self.items[row]
+
+
 class MathGameUI:
     """Touch-friendly UI for the MathMaster game using Pythonista UI"""
     
     def __init__(self):
         """Initialize the UI components and game state"""
-        # Always create these elements regardless of environment
+        # Early exit if not in Pythonista environment - the game modules
+        # aren't even imported then (see the imports at the top)
+        if not PYTHONISTA_AVAILABLE:
+            return
+        
         self.game = MathGame()
         self.high_scores = HighScoreManager()
         self.question_module = QuestionGenerator
@@ -41,60 +141,79 @@ class MathGameUI:
         # Game state variables
         self.current_question = None
         self.correct_answer = None
-        self.round_start_time = None
+        self._round_t0 = None  # time.monotonic() at the start of a round
         self.round_num = 1
         self.operation_type = 1  # Default to addition
         self.difficulty = 1      # Default to easy
         
-        # Early exit if not in Pythonista environment
-        # The global PYTHONISTA_AVAILABLE flag is already set at module level
-        if not PYTHONISTA_AVAILABLE:
-            return
-        
         # Pythonista-specific UI initialization
         self.current_view = None
         self.timer = None
         self.timer_running = False
         self.countdown_seconds = 0
+        self._timer_epoch = 0  # Current timed countdown (see start_countdown)
+        
+        # Elapsed time display for normal rounds (see start_timer_update);
+        # bumping the generation invalidates any tick still scheduled
+        self._timer_gen = 0
+        self._timer_view = None
+        self._timer_label = None
+        self._timed_widgets = None  # Timed game screen labels and field
+        self._editing_field = None  # Answer field that has the keyboard
+        self._flash_view = None
+        self._flash_gen = 0  # Bumped per flash; older pending hides just exit
+        
+        # Create main menu and use it as the navigation root, so returning
+        # to the menu is a pop instead of a rebuild
+        self.setup_main_menu()
         
-        # Create root view for navigation
-        root_view = ui.View()
-        root_view.name = 'MathMaster'
-        root_view.background_color = BACKGROUND_COLOR
-        
-        # Setup main navigation with the root view
-        self.nav_view = ui.NavigationView(root_view)
+        # Setup main navigation with the main menu as its root view
+        self.nav_view = ui.NavigationView(self.current_view)
         self.nav_view.name = 'MathMaster'
         self.nav_view.background_color = BACKGROUND_COLOR
         self.nav_view.tint_color = TINT_COLOR
         
-        # Create main menu
-        self.setup_main_menu()
+        # Screens visited on every game are built once and updated on entry
+        # instead of rebuilding their view trees per navigation
+        self._op_view = self._build_operations_view()
+        self._diff_view = self._build_difficulty_view()
+        self._rounds_view = self._build_rounds_view()
+        self._game_screen = self._build_game_screen()
+        self._result_screen = self._build_result_screen()
+        self._summary_view = self._build_summary_view()
+        
+        # Rarely visited screens are built on first use (see show_high_scores,
+        # show_timed_setup and show_about)
+        self._hs_view = None
+        self._hs_normal = []
+        self._hs_timed = []
+        self._hs_stale = True  # Rows need rebuilding (a score was saved since)
+        self._timed_setup_view = None
+        self._about_view = None
     
     def setup_main_menu(self):
         """Setup the main menu view"""
         main_view = ui.View()
         main_view.name = 'MathMaster'
         main_view.background_color = BACKGROUND_COLOR
+        children = []
         
         # Title label
-        title_label = ui.Label(frame=(0, 50, 500, 50))
+        title_label = ui.Label(frame=(0, 55, main_view.width, 50))
         title_label.text = 'MathMaster'
         title_label.alignment = ui.ALIGN_CENTER
-        title_label.font = ('Helvetica-Bold', 28)
+        title_label.font = _FONT_TITLE_LG
         title_label.text_color = TINT_COLOR
-        title_label.center = (main_view.width * 0.5, 80)
-        title_label.flex = 'WLRTB'
-        main_view.add_subview(title_label)
+        title_label.flex = 'W'
+        children.append(title_label)
         
         # Subtitle
-        subtitle = ui.Label(frame=(0, 110, 500, 30))
+        subtitle = ui.Label(frame=(0, 105, main_view.width, 30))
         subtitle.text = 'Improve your math skills with practice'
         subtitle.alignment = ui.ALIGN_CENTER
-        subtitle.font = ('Helvetica', 16)
-        subtitle.center = (main_view.width * 0.5, 120)
-        subtitle.flex = 'WLRTB'
-        main_view.add_subview(subtitle)
+        subtitle.font = _FONT_BODY
+        subtitle.flex = 'W'
+        children.append(subtitle)
         
         # Create menu buttons
         y_offset = 180
@@ -106,7 +225,7 @@ class MathGameUI:
                                       action=self.show_operations)
         operations_btn.center = (main_view.width * 0.5, y_offset + button_height/2)
         operations_btn.flex = 'LR'
-        main_view.add_subview(operations_btn)
+        children.append(operations_btn)
         
         y_offset += 70
         timed_btn = self.create_button('Timed Challenge', 
@@ -114,7 +233,7 @@ class MathGameUI:
                                   action=self.show_timed_setup)
         timed_btn.center = (main_view.width * 0.5, y_offset + button_height/2)
         timed_btn.flex = 'LR'
-        main_view.add_subview(timed_btn)
+        children.append(timed_btn)
         
         y_offset += 70
         scores_btn = self.create_button('High Scores', 
@@ -122,7 +241,7 @@ class MathGameUI:
                                    action=self.show_high_scores)
         scores_btn.center = (main_view.width * 0.5, y_offset + button_height/2)
         scores_btn.flex = 'LR'
-        main_view.add_subview(scores_btn)
+        children.append(scores_btn)
         
         y_offset += 70
         settings_btn = self.create_button('About', 
@@ -130,11 +249,26 @@ class MathGameUI:
                                     action=self.show_about)
         settings_btn.center = (main_view.width * 0.5, y_offset + button_height/2)
         settings_btn.flex = 'LR'
-        main_view.add_subview(settings_btn)
+        children.append(settings_btn)
+        
+        # Attach all children in one call
+        self._add_subviews(main_view, children)
         
-        # Set the main view
+        # Set the main view (the root of the navigation view)
         self.current_view = main_view
-        self.nav_view.push_view(main_view)
+    
+    def _add_subviews(self, parent, children):
+        """
+        Add children to parent through one detached container view
+        
+        The container has no superview while it is filled, so adding the
+        children doesn't trigger layout; attaching it is a single call.
+        """
+        container = ui.View(frame=parent.bounds, flex='WH')
+        for child in children:
+            container.add_subview(child)
+        parent.add_subview(container)
+        return container
     
     def create_button(self, title, frame=(0, 0, 200, 50), action=None):
         """Helper to create a styled button"""
@@ -146,33 +280,20 @@ class MathGameUI:
         button.action = action
         return button
     
-    def show_operations(self, sender):
-        """Show the operations selection menu"""
+    def _build_operations_view(self):
+        """Build the operations selection menu (once, reused on every visit)"""
         op_view = ui.View()
         op_view.name = 'Select Operation'
         op_view.background_color = BACKGROUND_COLOR
-        
-        # Create operation buttons
-        operations = {
-            1: "Addition",
-            2: "Subtraction",
-            3: "Multiplication",
-            4: "Division",
-            5: "Fractions",
-            6: "Percentages",
-            7: "Exponents",
-            8: "Arrays",
-            9: "Mixed Challenge"
-        }
+        children = []
         
         # Instructions
-        instructions = ui.Label(frame=(0, 50, 500, 30))
+        instructions = ui.Label(frame=(0, 35, op_view.width, 30))
         instructions.text = 'Select an operation to practice:'
         instructions.alignment = ui.ALIGN_CENTER
-        instructions.font = ('Helvetica-Bold', 18)
-        instructions.center = (op_view.width * 0.5, 50)
-        instructions.flex = 'WLRTB'
-        op_view.add_subview(instructions)
+        instructions.font = _FONT_BODY_BOLD
+        instructions.flex = 'W'
+        children.append(instructions)
         
         # Create a button for each operation
         y_offset = 100
@@ -180,49 +301,46 @@ class MathGameUI:
         button_width = 250
         button_spacing = 15
         
-        for op_id, op_name in operations.items():
+        for op_name, op_id in _OPERATIONS:
             btn = self.create_button(op_name, 
                                frame=(0, y_offset, button_width, button_height))
             btn.center = (op_view.width * 0.5, y_offset + button_height/2)
             btn.flex = 'LR'
             
-            # Store operation ID in button's name for reference in handler
-            btn.name = str(op_id)
-            btn.action = self.operation_selected
+            # Bind the operation ID to the handler
+            btn.action = partial(self.operation_selected, op_id=op_id)
             
-            op_view.add_subview(btn)
+            children.append(btn)
             y_offset += button_height + button_spacing
         
-        self.nav_view.push_view(op_view)
+        # Attach all children in one call
+        self._add_subviews(op_view, children)
+        
+        return op_view
+    
+    def show_operations(self, sender):
+        """Show the operations selection menu"""
+        self.nav_view.push_view(self._op_view)
     
-    def operation_selected(self, sender):
+    def operation_selected(self, sender, op_id):
         """Handle operation selection"""
-        self.operation_type = int(sender.name)
+        self.operation_type = op_id
         self.show_difficulty()
     
-    def show_difficulty(self):
-        """Show the difficulty selection menu"""
+    def _build_difficulty_view(self):
+        """Build the difficulty selection menu (once, reused on every visit)"""
         diff_view = ui.View()
         diff_view.name = 'Select Difficulty'
         diff_view.background_color = BACKGROUND_COLOR
+        children = []
         
-        # Create difficulty options
-        difficulties = {
-            1: "Easy",
-            2: "Medium",
-            3: "Hard",
-            4: "Adaptive"
-        }
-        
-        # Instructions
-        op_name = self.question_module.get_operation_name(self.operation_type)
-        instructions = ui.Label(frame=(0, 50, 500, 30))
-        instructions.text = f'Select difficulty for {op_name}:'
+        # Instructions (text is set on entry for the chosen operation)
+        instructions = ui.Label(frame=(0, 35, diff_view.width, 30))
         instructions.alignment = ui.ALIGN_CENTER
-        instructions.font = ('Helvetica-Bold', 18)
-        instructions.center = (diff_view.width * 0.5, 50)
-        instructions.flex = 'WLRTB'
-        diff_view.add_subview(instructions)
+        instructions.font = _FONT_BODY_BOLD
+        instructions.flex = 'W'
+        children.append(instructions)
+        self._diff_instructions = instructions
         
         # Create a button for each difficulty
         y_offset = 100
@@ -230,40 +348,48 @@ class MathGameUI:
         button_width = 250
         button_spacing = 20
         
-        for diff_id, diff_name in difficulties.items():
+        for diff_name, diff_id in _DIFFICULTIES:
             btn = self.create_button(diff_name, 
                                frame=(0, y_offset, button_width, button_height))
             btn.center = (diff_view.width * 0.5, y_offset + button_height/2)
             btn.flex = 'LR'
             
-            # Store difficulty ID in button's name for reference in handler
-            btn.name = str(diff_id)
-            btn.action = self.difficulty_selected
+            # Bind the difficulty ID to the handler
+            btn.action = partial(self.difficulty_selected, diff_id=diff_id)
             
-            diff_view.add_subview(btn)
+            children.append(btn)
             y_offset += button_height + button_spacing
         
-        self.nav_view.push_view(diff_view)
+        # Attach all children in one call
+        self._add_subviews(diff_view, children)
+        
+        return diff_view
     
-    def difficulty_selected(self, sender):
+    def show_difficulty(self):
+        """Show the difficulty selection menu"""
+        op_name = self.question_module.get_operation_name(self.operation_type)
+        self._diff_instructions.text = f'Select difficulty for {op_name}:'
+        self.nav_view.push_view(self._diff_view)
+    
+    def difficulty_selected(self, sender, diff_id):
         """Handle difficulty selection"""
-        self.difficulty = int(sender.name)
+        self.difficulty = diff_id
         self.show_rounds_selection()
     
-    def show_rounds_selection(self):
-        """Show the rounds selection view"""
+    def _build_rounds_view(self):
+        """Build the rounds selection view (once, reused on every visit)"""
         rounds_view = ui.View()
         rounds_view.name = 'Number of Rounds'
         rounds_view.background_color = BACKGROUND_COLOR
+        children = []
         
         # Instructions
-        instructions = ui.Label(frame=(0, 50, 500, 30))
+        instructions = ui.Label(frame=(0, 35, rounds_view.width, 30))
         instructions.text = 'How many rounds?'
         instructions.alignment = ui.ALIGN_CENTER
-        instructions.font = ('Helvetica-Bold', 18)
-        instructions.center = (rounds_view.width * 0.5, 50)
-        instructions.flex = 'WLRTB'
-        rounds_view.add_subview(instructions)
+        instructions.font = _FONT_BODY_BOLD
+        instructions.flex = 'W'
+        children.append(instructions)
         
         # Round number options
         round_options = [5, 10, 15, 20]
@@ -280,19 +406,23 @@ class MathGameUI:
             btn.center = (rounds_view.width * 0.5, y_offset + button_height/2)
             btn.flex = 'LR'
             
-            # Store round count in button's name
-            btn.name = str(rounds)
-            btn.action = self.rounds_selected
+            # Bind the round count to the handler
+            btn.action = partial(self.rounds_selected, rounds=rounds)
             
-            rounds_view.add_subview(btn)
+            children.append(btn)
             y_offset += button_height + button_spacing
         
-        self.nav_view.push_view(rounds_view)
+        # Attach all children in one call
+        self._add_subviews(rounds_view, children)
+        
+        return rounds_view
+    
+    def show_rounds_selection(self):
+        """Show the rounds selection view"""
+        self.nav_view.push_view(self._rounds_view)
     
-    def rounds_selected(self, sender):
+    def rounds_selected(self, sender, rounds):
         """Handle rounds selection and start game"""
-        rounds = int(sender.name)
-        
         # Set up game
         self.game.setup_game(
             operation_type=self.operation_type,
@@ -306,40 +436,26 @@ class MathGameUI:
         # Start first question
         self.show_game_screen()
     
-    def show_game_screen(self):
-        """Display the game screen with question"""
+    def _build_game_screen(self):
+        """Build the game screen once; show_game_screen fills it in per round"""
         game_view = ui.View()
         game_view.name = 'MathMaster'
         game_view.background_color = BACKGROUND_COLOR
-        
-        # Generate question
-        question_data = self.game.generate_question()
-        self.current_question = question_data[0]
-        self.correct_answer = question_data[1]
-        
-        # Update round counter
-        self.round_num = self.game.current_round
-        
-        # Record start time
-        self.round_start_time = datetime.now()
+        children = []
         
         # Round info label
-        round_label = ui.Label(frame=(0, 30, 500, 30))
-        round_label.text = f'Round {self.round_num} of {self.game.total_rounds}'
+        round_label = ui.Label(frame=(0, 30, game_view.width, 30))
         round_label.alignment = ui.ALIGN_CENTER
-        round_label.font = ('Helvetica', 16)
-        round_label.center = (game_view.width * 0.5, 45)
-        round_label.flex = 'WLRTB'
-        game_view.add_subview(round_label)
+        round_label.font = _FONT_BODY
+        round_label.flex = 'W'
+        children.append(round_label)
         
         # Question label
-        question_label = ui.Label(frame=(0, 90, 500, 50))
-        question_label.text = f'Calculate: {self.current_question}'
+        question_label = ui.Label(frame=(0, 85, game_view.width, 50))
         question_label.alignment = ui.ALIGN_CENTER
-        question_label.font = ('Helvetica-Bold', 24)
-        question_label.center = (game_view.width * 0.5, 110)
-        question_label.flex = 'WLRTB'
-        game_view.add_subview(question_label)
+        question_label.font = _FONT_TITLE
+        question_label.flex = 'W'
+        children.append(question_label)
         
         # Answer field
         answer_field = ui.TextField(frame=(0, 180, 200, 40))
@@ -349,24 +465,23 @@ class MathGameUI:
         answer_field.clear_button_mode = 'while_editing'
         answer_field.autocorrection_type = False
         answer_field.spellchecking_type = False
-        answer_field.font = ('Helvetica', 20)
+        answer_field.font = _FONT_INPUT
         answer_field.center = (game_view.width * 0.5, 200)
         answer_field.flex = 'LR'
         answer_field.border_width = 1
         answer_field.corner_radius = 5
         answer_field.border_color = LIGHT_GRAY
-        game_view.add_subview(answer_field)
+        answer_field.delegate = self  # Tracks focus (see textfield_did_begin_editing)
+        children.append(answer_field)
         
         # Timer label (updating)
-        timer_label = ui.Label(frame=(0, 240, 500, 30))
-        timer_label.text = f'Time: 0.0s'
+        timer_label = ui.Label(frame=(0, 240, game_view.width, 30))
         timer_label.alignment = ui.ALIGN_CENTER
-        timer_label.font = ('Helvetica', 16)
+        timer_label.font = _FONT_BODY
         timer_label.text_color = 'gray'
-        timer_label.center = (game_view.width * 0.5, 255)
-        timer_label.flex = 'WLRTB'
+        timer_label.flex = 'W'
         timer_label.name = 'timer_label'
-        game_view.add_subview(timer_label)
+        children.append(timer_label)
         
         # Submit button
         submit_btn = self.create_button('Submit', 
@@ -374,38 +489,103 @@ class MathGameUI:
                                   action=self.check_answer)
         submit_btn.center = (game_view.width * 0.5, 325)
         submit_btn.flex = 'LR'
-        # Store reference to the answer field for use in the handler
         submit_btn.name = 'answer_submit'
-        submit_btn.answer_field = answer_field
-        game_view.add_subview(submit_btn)
+        children.append(submit_btn)
+        
+        self._round_label = round_label
+        self._question_label = question_label
+        self._answer_field = answer_field
+        self._timer_label = timer_label
+        # Attach all children in one call
+        self._add_subviews(game_view, children)
+        
+        return game_view
+    
+    def show_game_screen(self, push=True):
+        """
+        Display the game screen with the next question
+        
+        The screen is built once; each round only updates its labels. Pass
+        push=False when the game screen is already on the navigation stack.
+        """
+        # Generate question
+        question_data = self.game.generate_question(QuestionGenerator)
+        self.current_question = question_data[0]
+        self.correct_answer = question_data[1]
+        
+        # Update round counter
+        self.round_num = self.game.current_round
+        
+        # Record start time (monotonic clock, elapsed time only)
+        self._round_t0 = time.monotonic()
+        
+        self._round_label.text = f'Round {self.round_num} of {self.game.total_rounds}'
+        self._question_label.text = f'Calculate: {self.current_question}'
+        self._timer_label.text = 'Time: 0.0s'
+        # The same field is kept across rounds and never ends editing between
+        # them, so the keyboard stays up; only leaving the game dismisses it
+        self._answer_field.text = ''
         
         # Start timer update
-        self.start_timer_update(game_view, timer_label)
+        self.start_timer_update(self._game_screen, self._timer_label)
         
         # Set focus to the answer field for immediate typing
-        answer_field.begin_editing()
+        self._focus_answer(self._answer_field)
         
-        # Replace the current view with the game view
-        self.nav_view.push_view(game_view)
+        if push:
+            self.nav_view.push_view(self._game_screen)
+    
+    def next_question(self, sender):
+        """Go back from the result screen to the (cached) game screen"""
+        # Popping instead of pushing keeps the stack at game -> result
+        # for the whole game
+        self.show_game_screen(push=False)
+        self.nav_view.pop_view()
+    
+    def textfield_did_begin_editing(self, textfield):
+        """Answer field delegate: the field got the keyboard"""
+        self._editing_field = textfield
+    
+    def textfield_did_end_editing(self, textfield):
+        """Answer field delegate: the field lost the keyboard"""
+        if self._editing_field is textfield:
+            self._editing_field = None
+    
+    def _focus_answer(self, answer_field):
+        """Give an answer field the keyboard unless it already has it"""
+        if self._editing_field is not answer_field:
+            answer_field.begin_editing()
     
     def start_timer_update(self, view, timer_label):
         """Start a timer to update the elapsed time display"""
-        def update_timer():
-            elapsed = (datetime.now() - self.round_start_time).total_seconds()
-            timer_label.text = f'Time: {elapsed:.1f}s'
-            if view.on_screen:
-                ui.delay(update_timer, 0.1)
-        
-        ui.delay(update_timer, 0.1)
+        # One persistent tick method instead of a new closure per round.
+        # Each start gets a new generation, so a tick left over from an
+        # earlier round exits without touching the view
+        self._timer_gen += 1
+        self._timer_view = view
+        self._timer_label = timer_label
+        ui.delay(partial(self._update_round_timer, self._timer_gen), 0.1)
+    
+    def _stop_timer_update(self):
+        """Invalidate the elapsed time display's scheduled ticks"""
+        self._timer_gen += 1
+    
+    def _update_round_timer(self, gen):
+        """Refresh the elapsed time label and reschedule until stopped"""
+        if gen != self._timer_gen or not self._timer_view.on_screen:
+            return
+        elapsed = time.monotonic() - self._round_t0
+        self._timer_label.text = f'Time: {elapsed:.1f}s'
+        ui.delay(partial(self._update_round_timer, gen), 0.1)
     
     def check_answer(self, sender):
         """Check the provided answer and show feedback"""
         # Get the answer from the text field
-        answer_field = sender.answer_field
-        user_answer = answer_field.text.strip()
+        user_answer = self._answer_field.text.strip()
         
-        # Calculate time taken
-        time_taken = (datetime.now() - self.round_start_time).total_seconds()
+        # Calculate time taken and stop the elapsed time display
+        time_taken = time.monotonic() - self._round_t0
+        self._stop_timer_update()
         
         # Check answer and get result
         result = self.game.check_answer(user_answer, time_taken)
@@ -413,98 +593,100 @@ class MathGameUI:
         # Display result
         self.show_answer_result(result)
     
-    def show_answer_result(self, result):
-        """Display the result of the answer check"""
+    def _build_result_screen(self):
+        """Build the answer result screen once; show_answer_result fills it in"""
         result_view = ui.View()
         result_view.background_color = BACKGROUND_COLOR
+        children = []
         
-        # Status icon and color
-        status_text = '✓' if result['correct'] else '✗'
-        status_color = CORRECT_COLOR if result['correct'] else INCORRECT_COLOR
+        # Large status indicator (prerendered ✓/✗ image)
+        status_image = ui.ImageView(frame=(0, 80, result_view.width, 100))
+        status_image.content_mode = ui.CONTENT_CENTER
+        status_image.flex = 'W'
+        children.append(status_image)
         
-        # Large status indicator
-        status_label = ui.Label(frame=(0, 80, 200, 100))
-        status_label.text = status_text
-        status_label.alignment = ui.ALIGN_CENTER
-        status_label.font = ('Helvetica-Bold', 80)
-        status_label.text_color = status_color
-        status_label.center = (result_view.width * 0.5, 130)
-        status_label.flex = 'WLRTB'
-        result_view.add_subview(status_label)
+        # Result text
+        result_label = ui.Label(frame=(0, 200, result_view.width, 40))
+        result_label.alignment = ui.ALIGN_CENTER
+        result_label.font = _FONT_BODY_LG
+        result_label.flex = 'W'
+        children.append(result_label)
+        
+        # Time info
+        time_label = ui.Label(frame=(0, 245, result_view.width, 30))
+        time_label.alignment = ui.ALIGN_CENTER
+        time_label.font = _FONT_BODY
+        time_label.flex = 'W'
+        children.append(time_label)
+        
+        # Streak info (hidden unless the result has one)
+        streak_label = ui.Label(frame=(0, 275, result_view.width, 30))
+        streak_label.alignment = ui.ALIGN_CENTER
+        streak_label.font = _FONT_BODY
+        streak_label.flex = 'W'
+        children.append(streak_label)
+        
+        # Continue button (title and action are set per result)
+        continue_btn = self.create_button('Next Question', 
+                                  frame=(0, 320, 200, 50))
+        continue_btn.center = (result_view.width * 0.5, 345)
+        continue_btn.flex = 'LR'
+        children.append(continue_btn)
+        
+        self._status_image = status_image
+        self._result_label = result_label
+        self._result_time_label = time_label
+        self._streak_label = streak_label
+        self._continue_btn = continue_btn
+        # Attach all children in one call
+        self._add_subviews(result_view, children)
+        
+        return result_view
+    
+    def show_answer_result(self, result):
+        """Display the result of the answer check"""
+        self._status_image.image = _CHECK_IMG if result['correct'] else _CROSS_IMG
         
         # Result text
         if result['correct']:
-            result_text = f"Correct! +{result['score']} points"
+            self._result_label.text = f"Correct! +{result['score']} points"
         else:
-            result_text = f"Incorrect. The answer was {result['correct_answer']}"
-        
-        result_label = ui.Label(frame=(0, 200, 300, 40))
-        result_label.text = result_text
-        result_label.alignment = ui.ALIGN_CENTER
-        result_label.font = ('Helvetica', 18)
-        result_label.center = (result_view.width * 0.5, 220)
-        result_label.flex = 'WLRTB'
-        result_view.add_subview(result_label)
+            self._result_label.text = f"Incorrect. The answer was {result['correct_answer']}"
         
         # Time info
-        time_label = ui.Label(frame=(0, 240, 300, 30))
-        time_label.text = f"Time: {result['time_taken']:.2f} seconds"
-        time_label.alignment = ui.ALIGN_CENTER
-        time_label.font = ('Helvetica', 16)
-        time_label.center = (result_view.width * 0.5, 260)
-        time_label.flex = 'WLRTB'
-        result_view.add_subview(time_label)
+        self._result_time_label.text = f"Time: {result['time_taken']:.2f} seconds"
         
         # Streak info if available
         if 'streak' in result:
-            streak_label = ui.Label(frame=(0, 280, 300, 30))
-            streak_label.text = f"Current streak: {result['streak']}"
-            streak_label.alignment = ui.ALIGN_CENTER
-            streak_label.font = ('Helvetica', 16)
-            streak_label.center = (result_view.width * 0.5, 290)
-            streak_label.flex = 'WLRTB'
-            result_view.add_subview(streak_label)
+            self._streak_label.text = f"Current streak: {result['streak']}"
+            self._streak_label.hidden = False
+        else:
+            self._streak_label.hidden = True
         
         # Continue button
         if self.game.current_round <= self.game.total_rounds:
-            continue_btn = self.create_button('Next Question', 
-                                      frame=(0, 320, 200, 50),
-                                      action=self.show_game_screen)
+            self._continue_btn.title = 'Next Question'
+            self._continue_btn.action = self.next_question
         else:
-            continue_btn = self.create_button('See Results', 
-                                      frame=(0, 320, 200, 50),
-                                      action=self.show_game_summary)
+            self._continue_btn.title = 'See Results'
+            self._continue_btn.action = self.show_game_summary
         
-        continue_btn.center = (result_view.width * 0.5, 345)
-        continue_btn.flex = 'LR'
-        result_view.add_subview(continue_btn)
-        
-        self.nav_view.push_view(result_view)
+        self.nav_view.push_view(self._result_screen)
     
-    def show_game_summary(self, sender=None):
-        """Display game summary and stats"""
+    def _build_summary_view(self):
+        """Build the game summary screen once; show_game_summary fills it in"""
         summary_view = ui.View()
         summary_view.name = 'Game Summary'
         summary_view.background_color = BACKGROUND_COLOR
-        
-        # Get game results
-        results = self.game.get_results()
-        
-        # Calculate stats
-        total_rounds = len(results)
-        correct_count = sum(1 for r in results if r['correct'])
-        accuracy = (correct_count / total_rounds) * 100 if total_rounds > 0 else 0
-        avg_time = sum(r['time_taken'] for r in results) / total_rounds if total_rounds > 0 else 0
-        total_score = sum(r.get('score', 0) for r in results)
+        children = []
         
         # Title
-        title_label = ui.Label(frame=(0, 30, 500, 40))
+        title_label = ui.Label(frame=(0, 30, summary_view.width, 40))
         title_label.text = 'Game Summary'
         title_label.alignment = ui.ALIGN_CENTER
-        title_label.font = ('Helvetica-Bold', 24)
-        title_label.center = (summary_view.width * 0.5, 50)
-        title_label.flex = 'WLRTB'
-        summary_view.add_subview(title_label)
+        title_label.font = _FONT_TITLE
+        title_label.flex = 'W'
+        children.append(title_label)
         
         # Stats container
         stats_view = ui.View(frame=(0, 90, 300, 160))
@@ -514,27 +696,14 @@ class MathGameUI:
         stats_view.center = (summary_view.width * 0.5, 170)
         stats_view.flex = 'LR'
         
-        # Stats labels
-        y_pos = 15
-        font_size = 16
-        line_height = 30
+        # Stats text - one multi-line label instead of a label per line
+        stats_label = ui.Label(frame=(20, 15, 260, 150))
+        stats_label.number_of_lines = 5
+        stats_label.font = _FONT_BODY
+        stats_view.add_subview(stats_label)
+        self._summary_stats_label = stats_label
         
-        stats_labels = [
-            f"Total Questions: {total_rounds}",
-            f"Correct Answers: {correct_count}",
-            f"Accuracy: {accuracy:.1f}%",
-            f"Average Time: {avg_time:.2f}s",
-            f"Total Score: {total_score} points"
-        ]
-        
-        for text in stats_labels:
-            label = ui.Label(frame=(20, y_pos, 260, line_height))
-            label.text = text
-            label.font = ('Helvetica', font_size)
-            stats_view.add_subview(label)
-            y_pos += line_height
-        
-        summary_view.add_subview(stats_view)
+        children.append(stats_view)
         
         # Action buttons
         y_offset = 280
@@ -548,7 +717,8 @@ class MathGameUI:
                                action=self.save_high_score)
         save_btn.center = (summary_view.width * 0.5, y_offset + button_height/2)
         save_btn.flex = 'LR'
-        summary_view.add_subview(save_btn)
+        children.append(save_btn)
+        self._summary_save_btn = save_btn
         
         # Main menu button
         y_offset += button_height + button_spacing
@@ -557,7 +727,45 @@ class MathGameUI:
                                action=self.return_to_main_menu)
         menu_btn.center = (summary_view.width * 0.5, y_offset + button_height/2)
         menu_btn.flex = 'LR'
-        summary_view.add_subview(menu_btn)
+        children.append(menu_btn)
+        
+        # Attach all children in one call
+        self._add_subviews(summary_view, children)
+        
+        return summary_view
+    
+    def show_game_summary(self, sender=None):
+        """Display game summary and stats"""
+        # Leaving the game - dismiss the answer keyboard
+        self._answer_field.end_editing()
+        
+        # Get game results
+        results = self.game.get_results()
+        
+        # Calculate stats in a single pass over the results
+        total_rounds = 0
+        correct_count = 0
+        time_sum = 0.0
+        total_score = 0
+        for r in results:
+            total_rounds += 1
+            correct_count += r['correct']  # bool adds as int
+            time_sum += r['time_taken']
+            total_score += r.get('score', 0)
+        accuracy = (correct_count / total_rounds) * 100 if total_rounds > 0 else 0
+        avg_time = time_sum / total_rounds if total_rounds > 0 else 0
+        
+        self._summary_stats_label.text = (
+            f"Total Questions: {total_rounds}\n"
+            f"Correct Answers: {correct_count}\n"
+            f"Accuracy: {accuracy:.1f}%\n"
+            f"Average Time: {avg_time:.2f}s\n"
+            f"Total Score: {total_score} points"
+        )
+        
+        # A new game's score can be saved again
+        self._summary_save_btn.enabled = True
+        self._summary_save_btn.background_color = TINT_COLOR
         
         # Save high score on game completion
         op_name = self.question_module.get_operation_name(self.operation_type)
@@ -575,7 +783,10 @@ class MathGameUI:
             'timed_mode': False
         }
         
-        self.nav_view.push_view(summary_view)
+        # Replace the result screen with the summary, so the stack doesn't
+        # keep the result screen under it
+        self.nav_view.pop_view(False)
+        self.nav_view.push_view(self._summary_view)
     
     def save_high_score(self, sender):
         """Save the current score to high scores"""
@@ -591,8 +802,13 @@ class MathGameUI:
                 'timed_mode': self.game_stats['timed_mode']
             }
             
-            # Save the score
+            # Save the score and write it out now - atexit hooks don't run
+            # when a Pythonista view is dismissed
             self.high_scores.add_high_score(score_data)
+            self.high_scores.flush()
+            
+            # Rebuild the cached high score rows on the next visit
+            self._hs_stale = True
             
             # Show confirmation
             console.hud_alert('Score saved!', 'success', 1.5)
@@ -603,42 +819,28 @@ class MathGameUI:
     
     def return_to_main_menu(self, sender):
         """Return to the main menu"""
-        # Clear the navigation stack and rebuild main menu
-        self.nav_view.close()
+        self._stop_timer_update()
+        self._stop_timed_challenge()
+        self._answer_field.end_editing()
         
-        # Create root view for navigation
-        root_view = ui.View()
-        root_view.name = 'MathMaster'
-        root_view.background_color = BACKGROUND_COLOR
-        
-        # Create new navigation view with root view
-        self.nav_view = ui.NavigationView(root_view)
-        self.nav_view.name = 'MathMaster'
-        self.nav_view.background_color = BACKGROUND_COLOR
-        self.nav_view.tint_color = TINT_COLOR
-        self.setup_main_menu()
-        
-        # Present the nav view again
-        self.nav_view.present('fullscreen')
+        # Pop back to the main menu (the navigation root). NavigationView
+        # only exposes pop_view, so use the underlying navigation controller
+        ObjCInstance(self.nav_view).navigationController().popToRootViewControllerAnimated_(True)
     
-    def show_high_scores(self, sender):
-        """Display the high scores screen"""
+    def _build_high_scores_view(self):
+        """Build the high scores screen (on first visit, then reused)"""
         hs_view = ui.View()
         hs_view.name = 'High Scores'
         hs_view.background_color = BACKGROUND_COLOR
+        children = []
         
         # Title
-        title_label = ui.Label(frame=(0, 30, 500, 40))
+        title_label = ui.Label(frame=(0, 30, hs_view.width, 40))
         title_label.text = 'High Scores'
         title_label.alignment = ui.ALIGN_CENTER
-        title_label.font = ('Helvetica-Bold', 24)
-        title_label.center = (hs_view.width * 0.5, 50)
-        title_label.flex = 'WLRTB'
-        hs_view.add_subview(title_label)
-        
-        # Get high scores
-        normal_scores = self.high_scores.get_high_scores(timed_mode=False)
-        timed_scores = self.high_scores.get_high_scores(timed_mode=True)
+        title_label.font = _FONT_TITLE
+        title_label.flex = 'W'
+        children.append(title_label)
         
         # Create segmented control for switching between normal/timed
         segments = ui.SegmentedControl(frame=(0, 90, 250, 30))
@@ -646,7 +848,8 @@ class MathGameUI:
         segments.center = (hs_view.width * 0.5, 105)
         segments.selected_index = 0
         segments.flex = 'LR'
-        hs_view.add_subview(segments)
+        segments.action = self._update_high_scores_table
+        children.append(segments)
         
         # Create a table for high scores
         table = ui.TableView(frame=(0, 140, 300, 300))
@@ -656,37 +859,10 @@ class MathGameUI:
         table.border_width = 1
         table.border_color = LIGHT_GRAY
         table.corner_radius = 10
-        hs_view.add_subview(table)
+        children.append(table)
         
         # Create data source for the table
         table_data = ui.ListDataSource([])
-        
-        # Function to update table data based on selected segment
-        def update_table(segment):
-            if segment.selected_index == 0:
-                # Normal mode
-                scores = normal_scores
-            else:
-                # Timed mode
-                scores = timed_scores
-            
-            # Format scores for display
-            formatted_scores = []
-            for score in scores:
-                formatted_scores.append({
-                    'title': f"{score['operation']} - {score['difficulty']}",
-                    'subtitle': f"Score: {score['score']} | Accuracy: {score['accuracy']:.1f}% | Time: {score['avg_time']:.2f}s",
-                    'accessory_type': 'detail_button'
-                })
-            
-            table_data.items = formatted_scores
-            table.reload()
-        
-        # Set initial data
-        segments.action = update_table
-        update_table(segments)
-        
-        # Set data source
         table.data_source = table_data
         table.delegate = table_data
         
@@ -696,56 +872,75 @@ class MathGameUI:
                               action=self.return_to_main_menu)
         back_btn.center = (hs_view.width * 0.5, 475)
         back_btn.flex = 'LR'
-        hs_view.add_subview(back_btn)
+        children.append(back_btn)
+        
+        # Attach all children in one call
+        self._add_subviews(hs_view, children)
         
-        self.nav_view.push_view(hs_view)
+        self._hs_segments = segments
+        self._hs_table = table
+        self._hs_table_data = table_data
+        return hs_view
     
-    def show_timed_setup(self, sender):
-        """Show timed challenge setup screen"""
+    def _update_high_scores_table(self, segment):
+        """Fill the high scores table for the selected segment"""
+        # Rows are formatted once per visit in show_high_scores
+        if segment.selected_index == 0:
+            # Normal mode
+            self._hs_table_data.items = self._hs_normal
+        else:
+            # Timed mode
+            self._hs_table_data.items = self._hs_timed
+        self._hs_table.reload()
+    
+    def show_high_scores(self, sender):
+        """Display the high scores screen"""
+        if self._hs_view is None:
+            self._hs_view = self._build_high_scores_view()
+        
+        # Get high scores and format their rows, unless nothing changed
+        # since the last visit
+        if self._hs_stale:
+            self._hs_normal = [_format_score_row(score) for score in
+                               self.high_scores.get_high_scores(timed_mode=False)]
+            self._hs_timed = [_format_score_row(score) for score in
+                              self.high_scores.get_high_scores(timed_mode=True)]
+            self._hs_stale = False
+        self._update_high_scores_table(self._hs_segments)
+        
+        self.nav_view.push_view(self._hs_view)
+    
+    def _build_timed_setup_view(self):
+        """Build the timed challenge setup screen (on first visit, then reused)"""
         timed_view = ui.View()
         timed_view.name = 'Timed Challenge'
         timed_view.background_color = BACKGROUND_COLOR
+        children = []
         
         # Title
-        title_label = ui.Label(frame=(0, 30, 500, 40))
+        title_label = ui.Label(frame=(0, 30, timed_view.width, 40))
         title_label.text = 'Timed Challenge'
         title_label.alignment = ui.ALIGN_CENTER
-        title_label.font = ('Helvetica-Bold', 24)
-        title_label.center = (timed_view.width * 0.5, 50)
-        title_label.flex = 'WLRTB'
-        timed_view.add_subview(title_label)
+        title_label.font = _FONT_TITLE
+        title_label.flex = 'W'
+        children.append(title_label)
         
         # Description
-        desc_label = ui.Label(frame=(0, 80, 320, 60))
+        desc_label = ui.Label(frame=(0, 80, timed_view.width, 60))
         desc_label.text = 'Solve as many questions as you can within the time limit!'
         desc_label.alignment = ui.ALIGN_CENTER
         desc_label.number_of_lines = 0
-        desc_label.font = ('Helvetica', 17)
-        desc_label.center = (timed_view.width * 0.5, 110)
-        desc_label.flex = 'WLRTB'
-        timed_view.add_subview(desc_label)
-        
-        # Operation selection (similar to regular mode)
-        operations = {
-            1: "Addition",
-            2: "Subtraction",
-            3: "Multiplication",
-            4: "Division",
-            5: "Fractions",
-            6: "Percentages",
-            7: "Exponents",
-            8: "Arrays",
-            9: "Mixed Challenge"
-        }
+        desc_label.font = _FONT_BODY_MD
+        desc_label.flex = 'W'
+        children.append(desc_label)
         
         # Operation label
-        op_label = ui.Label(frame=(0, 160, 500, 30))
+        op_label = ui.Label(frame=(0, 160, timed_view.width, 30))
         op_label.text = 'Select operation:'
         op_label.alignment = ui.ALIGN_CENTER
-        op_label.font = ('Helvetica-Bold', 18)
-        op_label.center = (timed_view.width * 0.5, 175)
-        op_label.flex = 'WLRTB'
-        timed_view.add_subview(op_label)
+        op_label.font = _FONT_BODY_BOLD
+        op_label.flex = 'W'
+        children.append(op_label)
         
         # Create picker for operations
         op_picker = ui.PickerView(frame=(0, 200, 300, 100))
@@ -753,54 +948,42 @@ class MathGameUI:
         op_picker.flex = 'LR'
         
         # Setup picker data
-        op_items = [op for op in operations.values()]
+        op_items = [op_name for op_name, op_id in _OPERATIONS]
         
-        class PickerDelegate:
-            def pickerView_numberOfRowsInComponent_(self, picker_view, component):
-                return len(op_items)
-            
-            def pickerView_titleForRow_forComponent_(self, picker_view, row, component):
-                return op_items[row]
-        
-        op_picker.data_source = PickerDelegate()
-        op_picker.delegate = PickerDelegate()
-        timed_view.add_subview(op_picker)
+        # One object serves as both data source and delegate; keep a
+        # reference so it lives as long as the picker
+        delegate = _OpPickerDelegate(op_items)
+        op_picker.data_source = delegate
+        op_picker.delegate = delegate
+        self._picker_delegate = delegate
+        children.append(op_picker)
         
         # Time limit label
-        time_label = ui.Label(frame=(0, 320, 500, 30))
+        time_label = ui.Label(frame=(0, 320, timed_view.width, 30))
         time_label.text = 'Select time limit:'
         time_label.alignment = ui.ALIGN_CENTER
-        time_label.font = ('Helvetica-Bold', 18)
-        time_label.center = (timed_view.width * 0.5, 335)
-        time_label.flex = 'WLRTB'
-        timed_view.add_subview(time_label)
+        time_label.font = _FONT_BODY_BOLD
+        time_label.flex = 'W'
+        children.append(time_label)
         
         # Time limit buttons
-        time_options = [30, 60, 120, 180, 300]  # In seconds
-        
         # Create buttons in horizontal layout
         button_width = 60
         button_height = 45
         button_spacing = 10
-        total_width = button_width * len(time_options) + button_spacing * (len(time_options) - 1)
-        x_offset = (timed_view.width - total_width) / 2
+        button_count = len(_TIMED_PRESET_BUTTONS)
+        total_width = button_width * button_count + button_spacing * (button_count - 1)
+        x_start = (timed_view.width - total_width) / 2
+        x_offsets = [x_start + i * (button_width + button_spacing) for i in range(button_count)]
         y_pos = 380
         
-        for seconds in time_options:
-            if seconds < 60:
-                time_text = f"{seconds}s"
-            else:
-                time_text = f"{seconds//60}m"
-                
+        for (seconds, time_text), x_offset in zip(_TIMED_PRESET_BUTTONS, x_offsets):
             time_btn = self.create_button(time_text, 
                                    frame=(x_offset, y_pos, button_width, button_height))
-            time_btn.name = str(seconds)
-            time_btn.action = self.start_timed_challenge
+            time_btn.action = partial(self.start_timed_challenge, time_limit=seconds)
             time_btn.op_picker = op_picker
             time_btn.op_items = op_items
-            timed_view.add_subview(time_btn)
-            
-            x_offset += button_width + button_spacing
+            children.append(time_btn)
         
         # Back button
         back_btn = self.create_button('Back', 
@@ -808,20 +991,26 @@ class MathGameUI:
                               action=self.return_to_main_menu)
         back_btn.center = (timed_view.width * 0.5, 475)
         back_btn.flex = 'LR'
-        timed_view.add_subview(back_btn)
+        children.append(back_btn)
         
-        self.nav_view.push_view(timed_view)
+        # Attach all children in one call
+        self._add_subviews(timed_view, children)
+        
+        return timed_view
     
-    def start_timed_challenge(self, sender):
+    def show_timed_setup(self, sender):
+        """Show timed challenge setup screen"""
+        if self._timed_setup_view is None:
+            self._timed_setup_view = self._build_timed_setup_view()
+        self.nav_view.push_view(self._timed_setup_view)
+    
+    def start_timed_challenge(self, sender, time_limit):
         """Start a timed challenge game"""
         # Get operation type from picker
         op_picker = sender.op_picker
         op_items = sender.op_items
         selected_op = op_picker.selected_row(0) + 1  # Operations are 1-indexed
         
-        # Get time limit from button
-        time_limit = int(sender.name)
-        
         # Set up timed game
         self.game.setup_timed_game(
             operation_type=selected_op,
@@ -829,7 +1018,8 @@ class MathGameUI:
             seconds=time_limit
         )
         
-        # Reset game state
+        # Retire the ticks of an earlier challenge and reset game state
+        self._stop_timed_challenge()
         self.round_num = 1
         self.timer_running = True
         self.countdown_seconds = time_limit
@@ -842,46 +1032,44 @@ class MathGameUI:
         game_view = ui.View()
         game_view.name = 'Timed Challenge'
         game_view.background_color = BACKGROUND_COLOR
+        cx = game_view.width * 0.5  # Horizontal center for the centered controls
         
         # Generate question
-        question_data = self.game.generate_question()
+        question_data = self.game.generate_question(QuestionGenerator)
         self.current_question = question_data[0]
         self.correct_answer = question_data[1]
         
         # Update round counter
         self.round_num = self.game.correct_count + self.game.wrong_count + 1
         
-        # Record start time
-        self.round_start_time = datetime.now()
+        # Record start time (monotonic clock, elapsed time only)
+        self._round_t0 = time.monotonic()
         
         # Create timer display
-        timer_label = ui.Label(frame=(0, 30, 500, 40))
-        timer_label.text = f'Time: {self.countdown_seconds}s'
+        timer_label = ui.Label(frame=(0, 30, game_view.width, 40))
+        timer_label.text = _TIMER_FMT(self.countdown_seconds)
         timer_label.alignment = ui.ALIGN_CENTER
-        timer_label.font = ('Helvetica-Bold', 24)
+        timer_label.font = _FONT_TITLE
         timer_label.text_color = TINT_COLOR
-        timer_label.center = (game_view.width * 0.5, 50)
-        timer_label.flex = 'WLRTB'
+        timer_label.flex = 'W'
         timer_label.name = 'timer_label'  # For referencing in timer update
         game_view.add_subview(timer_label)
         
         # Score display
-        score_label = ui.Label(frame=(0, 80, 500, 30))
-        score_label.text = f'Score: {self.game.total_score} | Solved: {self.game.correct_count}'
+        score_label = ui.Label(frame=(0, 80, game_view.width, 30))
+        score_label.text = _SCORE_FMT(self.game.total_score, self.game.correct_count)
         score_label.alignment = ui.ALIGN_CENTER
-        score_label.font = ('Helvetica', 17)
-        score_label.center = (game_view.width * 0.5, 95)
-        score_label.flex = 'WLRTB'
+        score_label.font = _FONT_BODY_MD
+        score_label.flex = 'W'
         score_label.name = 'score_label'  # For referencing in updates
         game_view.add_subview(score_label)
         
         # Question label
-        question_label = ui.Label(frame=(0, 140, 500, 50))
-        question_label.text = f'Calculate: {self.current_question}'
+        question_label = ui.Label(frame=(0, 140, game_view.width, 50))
+        question_label.text = _QUESTION_FMT(self.current_question)
         question_label.alignment = ui.ALIGN_CENTER
-        question_label.font = ('Helvetica-Bold', 24)
-        question_label.center = (game_view.width * 0.5, 165)
-        question_label.flex = 'WLRTB'
+        question_label.font = _FONT_TITLE
+        question_label.flex = 'W'
         game_view.add_subview(question_label)
         
         # Answer field
@@ -892,24 +1080,41 @@ class MathGameUI:
         answer_field.clear_button_mode = 'while_editing'
         answer_field.autocorrection_type = False
         answer_field.spellchecking_type = False
-        answer_field.font = ('Helvetica', 20)
-        answer_field.center = (game_view.width * 0.5, 240)
+        answer_field.font = _FONT_INPUT
+        answer_field.center = (cx, 240)
         answer_field.flex = 'LR'
         answer_field.border_width = 1
         answer_field.corner_radius = 5
         answer_field.border_color = LIGHT_GRAY
+        answer_field.delegate = self  # Tracks focus (see textfield_did_begin_editing)
         game_view.add_subview(answer_field)
         
         # Submit button
         submit_btn = self.create_button('Submit', 
                                   frame=(0, 290, 200, 50),
                                   action=self.check_timed_answer)
-        submit_btn.center = (game_view.width * 0.5, 315)
+        submit_btn.center = (cx, 315)
         submit_btn.flex = 'LR'
         submit_btn.name = 'answer_submit'
-        submit_btn.answer_field = answer_field
         game_view.add_subview(submit_btn)
         
+        # Answer feedback overlay, shown briefly after each answer; it
+        # ignores touches so it never blocks the field or the button
+        flash_view = ui.View(frame=game_view.bounds)
+        flash_view.flex = 'WH'
+        flash_view.alpha = 0
+        flash_view.touch_enabled = False
+        game_view.add_subview(flash_view)
+        self._flash_view = flash_view
+        
+        # Widgets updated after each answer (see check_timed_answer)
+        self._timed_widgets = {
+            'question': question_label,
+            'score': score_label,
+            'answer': answer_field,
+            'timer': timer_label
+        }
+        
         # Start timer countdown
         self.start_countdown(game_view, timer_label, score_label)
         
@@ -921,26 +1126,46 @@ class MathGameUI:
     
     def start_countdown(self, view, timer_label, score_label):
         """Start countdown timer for timed mode"""
+        # The time left is always derived from one monotonic deadline, so
+        # scheduling latency can't accumulate into drift
+        self._deadline = time.monotonic() + self.countdown_seconds
+        self._last_shown = self.countdown_seconds
+        self._timer_low = False
+        
+        # Ticks belong to one countdown; a newer one (or the summary)
+        # bumps the epoch and any still queued tick just exits
+        self._timer_epoch += 1
+        epoch = self._timer_epoch
+        
         def update_timer():
-            if not view.on_screen or not self.timer_running:
+            if epoch != self._timer_epoch or not self.timer_running:
+                return
+            if not view.on_screen:
+                # Left through the Back button - end the challenge here
+                self._stop_timed_challenge()
                 return
+            
+            time_left = self._deadline - time.monotonic()
+            remaining = math.ceil(time_left)
                 
-            if self.countdown_seconds <= 0:
+            if remaining <= 0:
                 # Time's up
                 self.timer_running = False
                 self.show_timed_summary()
                 return
             
-            # Update timer
-            self.countdown_seconds -= 1
-            timer_label.text = f'Time: {self.countdown_seconds}s'
-            
-            # Change color when time is low
-            if self.countdown_seconds <= 10:
-                timer_label.text_color = INCORRECT_COLOR
+            # Update timer only when the displayed second changes
+            if remaining != self._last_shown:
+                self._last_shown = remaining
+                timer_label.text = _TIMER_FMT(remaining)
+                
+                # Change color once when time gets low
+                if not self._timer_low and remaining <= 10:
+                    timer_label.text_color = INCORRECT_COLOR
+                    self._timer_low = True
             
-            # Schedule next update
-            ui.delay(update_timer, 1)
+            # Schedule next update near the next whole second
+            ui.delay(update_timer, max(0.05, time_left - (remaining - 1)))
         
         # Schedule first update
         ui.delay(update_timer, 1)
@@ -950,99 +1175,106 @@ class MathGameUI:
         if not self.timer_running:
             return
             
-        # Get the answer
-        answer_field = sender.answer_field
-        user_answer = answer_field.text.strip()
+        # Get the answer - plain digit strings (the common case on the number
+        # keyboard) convert straight to int; anything else, a blank answer
+        # included, is passed on as stripped text
+        w = self._timed_widgets
+        raw = w['answer'].text
+        user_answer = int(raw) if raw.isdecimal() else raw.strip()
         
         # Calculate time taken
-        time_taken = (datetime.now() - self.round_start_time).total_seconds()
+        time_taken = time.monotonic() - self._round_t0
         
         # Check answer
         result = self.game.check_answer(user_answer, time_taken)
         
-        # Quick feedback (flash green/red)
-        flash_view = ui.View(frame=(0, 0, 500, 500))
-        flash_view.background_color = CORRECT_COLOR if result['correct'] else INCORRECT_COLOR
-        flash_view.alpha = 0.3
-        self.nav_view.present_view.add_subview(flash_view)
-        
-        def remove_flash():
-            flash_view.remove_from_superview()
-        
-        ui.delay(remove_flash, 0.3)
+        # Quick feedback (flash green/red on the reused overlay)
+        self._flash_view.background_color = CORRECT_COLOR if result['correct'] else INCORRECT_COLOR
+        self._flash_view.alpha = 0.3
+        self._flash_gen += 1
+        ui.delay(partial(self._hide_flash, self._flash_gen), 0.3)
         
         # Generate next question if timer still running
         if self.timer_running:
-            # Generate new question
-            question_data = self.game.generate_question()
+            question_data = self.game.generate_question(QuestionGenerator)
             self.current_question = question_data[0]
             self.correct_answer = question_data[1]
             
-            # Update the view
-            question_label = self.nav_view.present_view.subviews[-5]  # Find the question label
-            score_label = self.nav_view.present_view.subviews[-6]     # Find the score label
-            
             # Update question and score
-            question_label.text = f'Calculate: {self.current_question}'
-            score_label.text = f'Score: {self.game.total_score} | Solved: {self.game.correct_count}'
+            w['question'].text = _QUESTION_FMT(self.current_question)
+            w['score'].text = _SCORE_FMT(self.game.total_score, self.game.correct_count)
             
             # Clear answer field
-            answer_field.text = ''
-            answer_field.begin_editing()
+            w['answer'].text = ''
+            self._focus_answer(w['answer'])
             
             # Reset start time
-            self.round_start_time = datetime.now()
+            self._round_t0 = time.monotonic()
+    
+    def _stop_timed_challenge(self):
+        """Stop the countdown of a timed challenge"""
+        self.timer_running = False
+        self._timer_epoch += 1
+    
+    def _hide_flash(self, gen):
+        """Hide the answer feedback overlay again, unless a newer flash replaced it"""
+        if gen == self._flash_gen:
+            self._flash_view.alpha = 0
     
     def show_timed_summary(self):
         """Show summary after timed challenge"""
+        # The challenge is over - no countdown tick may run after this
+        self._stop_timed_challenge()
+        
         summary_view = ui.View()
         summary_view.name = 'Challenge Complete'
         summary_view.background_color = BACKGROUND_COLOR
+        cx = summary_view.width * 0.5  # Horizontal center for the centered controls
         
         # Title
-        title_label = ui.Label(frame=(0, 30, 500, 40))
+        title_label = ui.Label(frame=(0, 30, summary_view.width, 40))
         title_label.text = 'Time\'s Up!'
         title_label.alignment = ui.ALIGN_CENTER
-        title_label.font = ('Helvetica-Bold', 28)
+        title_label.font = _FONT_TITLE_LG
         title_label.text_color = TINT_COLOR
-        title_label.center = (summary_view.width * 0.5, 50)
-        title_label.flex = 'WLRTB'
+        title_label.flex = 'W'
         summary_view.add_subview(title_label)
         
         # Get stats
         correct_count = self.game.correct_count
         wrong_count = self.game.wrong_count
         total_attempted = correct_count + wrong_count
-        accuracy = (correct_count / total_attempted) * 100 if total_attempted > 0 else 0
         total_score = self.game.total_score
         
+        # Rates - all 0 when nothing was attempted (att only guards the division)
+        att = total_attempted or 1
+        if total_attempted:
+            accuracy = 100.0 * correct_count / att
+            qpm = total_attempted / (self.game.time_limit / 60)
+            avg_time = self.game.time_limit / att
+        else:
+            accuracy = qpm = avg_time = 0.0
+        
         # Stats container
         stats_view = ui.View(frame=(0, 90, 300, 160))
         stats_view.border_width = 1
         stats_view.border_color = LIGHT_GRAY
         stats_view.corner_radius = 10
-        stats_view.center = (summary_view.width * 0.5, 170)
+        stats_view.center = (cx, 170)
         stats_view.flex = 'LR'
         
-        # Stats labels
-        y_pos = 15
-        font_size = 16
-        line_height = 30
-        
-        stats_labels = [
-            f"Questions Attempted: {total_attempted}",
-            f"Correct Answers: {correct_count}",
-            f"Accuracy: {accuracy:.1f}%",
-            f"Questions Per Minute: {(total_attempted / (self.game.time_limit / 60)):.1f}",
-            f"Total Score: {total_score} points"
-        ]
-        
-        for text in stats_labels:
-            label = ui.Label(frame=(20, y_pos, 260, line_height))
-            label.text = text
-            label.font = ('Helvetica', font_size)
-            stats_view.add_subview(label)
-            y_pos += line_height
+        # Stats text - one multi-line label instead of a label per line
+        stats_label = ui.Label(frame=(20, 15, 260, 150))
+        stats_label.number_of_lines = 5
+        stats_label.text = _SUMMARY_TMPL.format(
+            attempted=total_attempted,
+            correct=correct_count,
+            acc=accuracy,
+            qpm=qpm,
+            score=total_score
+        )
+        stats_label.font = _FONT_BODY
+        stats_view.add_subview(stats_label)
         
         summary_view.add_subview(stats_view)
         
@@ -1056,7 +1288,7 @@ class MathGameUI:
         save_btn = self.create_button('Save Score', 
                                frame=(0, y_offset, button_width, button_height),
                                action=self.save_timed_score)
-        save_btn.center = (summary_view.width * 0.5, y_offset + button_height/2)
+        save_btn.center = (cx, y_offset + button_height/2)
         save_btn.flex = 'LR'
         summary_view.add_subview(save_btn)
         
@@ -1065,7 +1297,7 @@ class MathGameUI:
         menu_btn = self.create_button('Main Menu', 
                                frame=(0, y_offset, button_width, button_height),
                                action=self.return_to_main_menu)
-        menu_btn.center = (summary_view.width * 0.5, y_offset + button_height/2)
+        menu_btn.center = (cx, y_offset + button_height/2)
         menu_btn.flex = 'LR'
         summary_view.add_subview(menu_btn)
         
@@ -1078,7 +1310,7 @@ class MathGameUI:
             'total_rounds': total_attempted,
             'correct_count': correct_count,
             'accuracy': accuracy,
-            'avg_time': self.game.time_limit / total_attempted if total_attempted > 0 else 0,
+            'avg_time': avg_time,
             'total_score': total_score,
             'operation': op_name,
             'difficulty': diff_name,
@@ -1091,19 +1323,19 @@ class MathGameUI:
         """Save timed challenge score"""
         self.save_high_score(sender)
     
-    def show_about(self, sender):
-        """Show about screen"""
+    def _build_about_view(self):
+        """Build the about screen (on first visit, then reused)"""
         about_view = ui.View()
         about_view.name = 'About MathMaster'
         about_view.background_color = BACKGROUND_COLOR
+        cx = about_view.width * 0.5  # Horizontal center for the centered controls
         
         # Title
-        title_label = ui.Label(frame=(0, 30, 500, 40))
+        title_label = ui.Label(frame=(0, 30, about_view.width, 40))
         title_label.text = 'About MathMaster'
         title_label.alignment = ui.ALIGN_CENTER
-        title_label.font = ('Helvetica-Bold', 24)
-        title_label.center = (about_view.width * 0.5, 50)
-        title_label.flex = 'WLRTB'
+        title_label.font = _FONT_TITLE
+        title_label.flex = 'W'
         about_view.add_subview(title_label)
         
         # App description
@@ -1126,7 +1358,7 @@ Tips:
 Version 1.0
 © 2023
 """
-        desc.font = ('Helvetica', 16)
+        desc.font = _FONT_BODY
         desc.editable = False
         desc.background_color = 'clear'
         about_view.add_subview(desc)
@@ -1135,11 +1367,17 @@ Version 1.0
         back_btn = self.create_button('Back', 
                               frame=(0, 400, 200, 50),
                               action=self.return_to_main_menu)
-        back_btn.center = (about_view.width * 0.5, 425)
+        back_btn.center = (cx, 425)
         back_btn.flex = 'LR'
         about_view.add_subview(back_btn)
         
-        self.nav_view.push_view(about_view)
+        return about_view
+    
+    def show_about(self, sender):
+        """Show about screen"""
+        if self._about_view is None:
+            self._about_view = self._build_about_view()
+        self.nav_view.push_view(self._about_view)
 
 
 def main():